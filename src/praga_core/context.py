@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from praga_core.action_executor import ActionExecutorMixin
 from praga_core.retriever import RetrieverAgentBase
@@ -37,11 +37,16 @@ class ServerContext(PageRouterMixin, ActionExecutorMixin):
 
     @classmethod
     async def create(
-        cls, root: str = "", cache_url: Optional[str] = None
+        cls, root: str = "", cache_url: Optional[str] = None, **cache_options: Any
     ) -> "ServerContext":
+        """Create a context with a page cache at `cache_url`.
+
+        Extra keyword arguments (pool settings, memory tier size, ...) are
+        passed on to `PageCache.create`.
+        """
         if cache_url is None:
             cache_url = "sqlite+aiosqlite:///:memory:"
-        page_cache = await PageCache.create(cache_url)
+        page_cache = await PageCache.create(cache_url, **cache_options)
         return cls(root, cache_url, _page_cache=page_cache)
 
     def register_service(self, name: str, service: Service) -> None:
@@ -7,5 +7,12 @@ provenance tracking support.
 
 from .core import PageCache
 from .exceptions import CacheValidationError, PageCacheError, ProvenanceError
+from .memory import PageMemoryCache
 
-__all__ = ["PageCache", "PageCacheError", "ProvenanceError", "CacheValidationError"]
+__all__ = [
+    "PageCache",
+    "PageCacheError",
+    "PageMemoryCache",
+    "ProvenanceError",
+    "CacheValidationError",
+]
@@ -1,29 +1,37 @@
 """Simplified PageCache implementation with clear separation of concerns."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
+from datetime import timedelta
 from typing import (
     Any,
     AsyncGenerator,
+    AsyncIterator,
     Awaitable,
     Callable,
+    Dict,
     Generic,
     List,
     Optional,
+    Sequence,
+    Tuple,
     Type,
     TypeVar,
     cast,
 )
 
 from sqlalchemy import Table
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool, StaticPool
+from sqlalchemy.pool import NullPool, QueuePool, StaticPool
 
 from ..types import Page, PageURI
+from .memory import PageMemoryCache
 from .provenance import ProvenanceManager
 from .query import PageQuery
 from .registry import PageRegistry
-from .schema import Base, PageRelationships
+from .schema import Base, PageIndex, PageRelationships
 from .storage import PageStorage
 from .validator import PageValidator
 
@@ -31,6 +39,14 @@ logger = logging.getLogger(__name__)
 
 P = TypeVar("P", bound=Page)
 
+# Default number of validator calls QueryBuilder runs at the same time
+DEFAULT_VALIDATION_CONCURRENCY = 16
+
+# Default connection pool settings for Postgres-backed caches
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_RECYCLE = 1800
+
 
 class PageCache:
     """A simplified, more readable PageCache implementation.
@@ -41,6 +57,7 @@ class PageCache:
     - PageValidator: Validation logic
     - PageQuery: Query building and execution
     - ProvenanceManager: Relationship tracking
+    - PageMemoryCache: Optional in-process tier in front of storage
 
     Use `await PageCache.create(url, drop_previous)` to instantiate.
     Direct use of the constructor is discouraged.
@@ -52,6 +69,8 @@ class PageCache:
         drop_previous: bool = False,
         _engine: Any = None,
         _session_factory: Any = None,
+        _memory_cache: Optional[PageMemoryCache] = None,
+        _validation_concurrency: int = DEFAULT_VALIDATION_CONCURRENCY,
     ) -> None:
         """Do not use directly. Use `await PageCache.create(...)` instead."""
         if _engine is not None and _session_factory is not None:
@@ -63,52 +82,98 @@ class PageCache:
                 "Use `await PageCache.create(url, drop_previous)` to instantiate PageCache."
             )
 
+        if _validation_concurrency <= 0:
+            raise ValueError(
+                f"validation_concurrency must be positive, got: {_validation_concurrency}"
+            )
+        self._validation_concurrency = _validation_concurrency
+
         # Initialize components
         self._registry = PageRegistry(self._engine)
-        self._storage = PageStorage(self._session_factory, self._registry)
-        self._validator = PageValidator()
+        self._storage = PageStorage(
+            self._session_factory, self._registry, memory_cache=_memory_cache
+        )
+        self._validator = PageValidator(on_validated=self._storage.mark_validated)
         self._query = PageQuery(self._session_factory, self._registry)
         self._provenance = ProvenanceManager(
             self._session_factory, self._storage, self._registry
         )
 
     @classmethod
-    async def create(cls, url: str, drop_previous: bool = False) -> "PageCache":
-        engine_args: dict[str, Any] = {}
-        if url.startswith("postgresql"):
-            engine_args["poolclass"] = NullPool
-        elif url.startswith("sqlite+aiosqlite://"):
-            engine_args["poolclass"] = StaticPool
-            engine_args["connect_args"] = {"check_same_thread": False}
+    async def create(
+        cls,
+        url: str,
+        drop_previous: bool = False,
+        memory_cache_entries: int = 0,
+        memory_cache_bytes: Optional[int] = None,
+        validation_concurrency: int = DEFAULT_VALIDATION_CONCURRENCY,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        pool_pre_ping: bool = True,
+        pool_recycle: Optional[int] = DEFAULT_POOL_RECYCLE,
+        statement_cache_size: Optional[int] = None,
+    ) -> "PageCache":
+        """Create a PageCache backed by the database at `url`.
+
+        Args:
+            url: SQLAlchemy async database URL
+            drop_previous: Drop all existing tables before creating them
+            memory_cache_entries: Maximum number of valid pages kept in the
+                in-process memory tier. 0 disables the tier.
+            memory_cache_bytes: Optional bound on the approximate total size
+                of the memory tier, in bytes
+            validation_concurrency: Maximum number of validator calls run at
+                the same time when validating query results
+            pool_size: Postgres only. Number of connections kept open in the
+                pool. 0 disables pooling and opens a connection per session.
+            max_overflow: Postgres only. Extra connections allowed beyond
+                pool_size under load
+            pool_pre_ping: Postgres only. Check connections are alive before
+                handing them out
+            pool_recycle: Postgres only. Seconds after which a pooled
+                connection is replaced, or None to keep connections forever
+            statement_cache_size: asyncpg only. Size of the per-connection
+                prepared statement cache, or None for the driver default
+        """
+        url, engine_args = engine_options(
+            url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=pool_pre_ping,
+            pool_recycle=pool_recycle,
+            statement_cache_size=statement_cache_size,
+        )
         engine = create_async_engine(url, **engine_args)
         session_factory = async_sessionmaker(engine, expire_on_commit=False)
         # Create tables
-        if drop_previous:
-            async with engine.begin() as conn:
+        async with engine.begin() as conn:
+            if drop_previous:
                 await conn.run_sync(Base.metadata.drop_all)
-                await conn.run_sync(Base.metadata.create_all)
-                # Explicitly ensure PageRelationships table is created
-                await conn.run_sync(
-                    lambda sync_conn: cast(Table, PageRelationships.__table__).create(
-                        sync_conn, checkfirst=True
-                    )
-                )
-        else:
-            async with engine.begin() as conn:
-                await conn.run_sync(Base.metadata.create_all)
-                # Explicitly ensure PageRelationships table is created
-                await conn.run_sync(
-                    lambda sync_conn: cast(Table, PageRelationships.__table__).create(
-                        sync_conn, checkfirst=True
-                    )
-                )
-        return cls(url, drop_previous, _engine=engine, _session_factory=session_factory)
+            await conn.run_sync(Base.metadata.create_all)
+            # Explicitly ensure the bookkeeping tables are created
+            for table in (PageRelationships.__table__, PageIndex.__table__):
+                await conn.run_sync(cast(Table, table).create, checkfirst=True)
+        memory_cache = (
+            PageMemoryCache(memory_cache_entries, memory_cache_bytes)
+            if memory_cache_entries > 0
+            else None
+        )
+        return cls(
+            url,
+            drop_previous,
+            _engine=engine,
+            _session_factory=session_factory,
+            _memory_cache=memory_cache,
+            _validation_concurrency=validation_concurrency,
+        )
 
     async def _reset_async(self) -> None:
         """Reset database and clear all state (async)."""
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
         self._registry.clear()
+        if self.memory_cache is not None:
+            self.memory_cache.clear()
         logger.debug("Reset database and cleared all state")
 
     # Core operations - simple and clear
@@ -131,6 +196,32 @@ class PageCache:
         # Store page
         return await self._storage.store(page, parent_uri)
 
+    async def store_many(
+        self, pages: Sequence[Page], parent_uri: Optional[PageURI] = None
+    ) -> List[bool]:
+        """Store many pages in one transaction, optionally under a shared parent.
+
+        Provenance is validated once per distinct parent rather than once per
+        page. Unlike `store`, pages that already exist are reported instead of
+        raising.
+
+        Returns a list aligned with `pages`: True if newly created, False if
+        the page already existed.
+        """
+        if parent_uri:
+            for page in pages:
+                page.parent_uri = parent_uri
+
+        # Validate provenance once for each distinct parent in the batch
+        by_parent: Dict[PageURI, List[Page]] = {}
+        for page in pages:
+            if page.parent_uri is not None:
+                by_parent.setdefault(page.parent_uri, []).append(page)
+        for effective_parent, children in by_parent.items():
+            await self._provenance.validate_relationships(children, effective_parent)
+
+        return await self._storage.store_many(pages, parent_uri)
+
     async def get(
         self, page_type: Type[P], uri: PageURI, allow_stale: bool = False
     ) -> Optional[P]:
@@ -145,18 +236,139 @@ class PageCache:
             return None
         return page
 
+    async def get_many(
+        self, page_type: Type[P], uris: Sequence[PageURI], allow_stale: bool = False
+    ) -> Dict[PageURI, P]:
+        """Get many pages of one type with one query per version mode (async).
+
+        Returns a mapping from each requested URI to its page. URIs that are
+        missing or fail validation are omitted. If allow_stale is True,
+        invalid pages are returned as well.
+        """
+        pages = await self._storage.get_many(
+            page_type, uris, ignore_validity=allow_stale
+        )
+        if allow_stale or not pages:
+            return pages
+
+        checks = await asyncio.gather(
+            *(self._validate_page_and_ancestors(page) for page in pages.values())
+        )
+        return {
+            uri: page
+            for (uri, page), is_valid in zip(pages.items(), checks)
+            if is_valid
+        }
+
+    async def lookup(
+        self, page_type: Type[P], uri: PageURI, allow_stale: bool = False
+    ) -> Tuple[Optional[P], PageURI]:
+        """Get a page with validation, resolving where a fresh copy would go (async).
+
+        The stored row and the latest version of its prefix are read with a
+        single query. Returns the page (None on a miss or failed validation)
+        together with the URI a newly generated page should be stored under:
+        the requested URI if it has a version, otherwise the next version
+        after the latest stored one.
+        """
+        page, latest_version = await self._storage.lookup(
+            page_type, uri, ignore_validity=allow_stale
+        )
+        if page is not None and (
+            allow_stale or await self._validate_page_and_ancestors(page)
+        ):
+            return page, page.uri
+        if uri.version is not None:
+            return None, uri
+        if latest_version is None and page is not None:
+            # Memory tier hits skip the version lookup
+            latest_version = page.uri.version
+        version = 1 if latest_version is None else latest_version + 1
+        return None, PageURI(root=uri.root, type=uri.type, id=uri.id, version=version)
+
+    async def store_if_absent(self, page: Page) -> bool:
+        """Store a page unless one already exists at its URI (async).
+
+        Unlike `store`, an existing page is not an error, and the write is a
+        single `INSERT ... ON CONFLICT DO NOTHING` rather than a SELECT
+        followed by an INSERT.
+
+        Returns True if newly created, False if it already existed.
+        """
+        if page.parent_uri is not None:
+            await self._provenance.validate_relationship(page, page.parent_uri)
+        await self._registry.ensure_registered(page.__class__)
+        return await self._storage.store_if_absent(page)
+
+    async def get_or_create(
+        self,
+        page_type: Type[P],
+        uri: PageURI,
+        create: Callable[[PageURI], Awaitable[P]],
+        allow_stale: bool = False,
+    ) -> P:
+        """Get a cached page, or create and store it on a miss (async).
+
+        Args:
+            page_type: The type of page to look up
+            uri: The page URI. Without a version, the latest valid page is
+                returned, or a new page is created at the next version.
+            create: Called with the resolved URI to generate the page on a miss
+            allow_stale: Return a cached page even if it is invalid
+        """
+        page, resolved_uri = await self.lookup(page_type, uri, allow_stale=allow_stale)
+        if page is not None:
+            return page
+        page = await create(resolved_uri)
+        await self.store_if_absent(page)
+        return page
+
     def find(self, page_type: Type[P]) -> "QueryBuilder[P]":
         """Start building a query for pages of the given type."""
-        return QueryBuilder(page_type, self._query, self._validator, self._storage)
+        return QueryBuilder(
+            page_type,
+            self._query,
+            self._validator,
+            self._storage,
+            max_concurrency=self._validation_concurrency,
+        )
 
     # Validation management
     def register_validator(
-        self, page_type: Type[P], validator: Callable[[P], Awaitable[bool]]
+        self,
+        page_type: Type[P],
+        validator: Callable[[P], Awaitable[bool]],
+        ttl: Optional[timedelta] = None,
     ) -> None:
-        """Register an validator function for a page type."""
-        self._validator.register(page_type, validator)
+        """Register an validator function for a page type.
+
+        If ttl is given, pages that passed validation within that window are
+        trusted without calling the validator. The last validation time is
+        stored with each page row, so the window survives restarts.
+        """
+        self._validator.register(page_type, validator, ttl=ttl)
 
     # Cache management
+    def pool_stats(self) -> Dict[str, Any]:
+        """Snapshot of the database connection pool, for watching saturation."""
+        pool = self._engine.pool
+        stats: Dict[str, Any] = {"pool": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            stats.update(
+                {
+                    "size": pool.size(),
+                    "checked_in": pool.checkedin(),
+                    "checked_out": pool.checkedout(),
+                    "overflow": pool.overflow(),
+                }
+            )
+        return stats
+
+    @property
+    def memory_cache(self) -> Optional[PageMemoryCache]:
+        """The in-process memory tier, or None when it is disabled."""
+        return self._storage.memory_cache
+
     async def invalidate(self, uri: PageURI) -> bool:
         """Mark a specific page as invalid."""
         return await self._storage.mark_invalid(uri)
@@ -215,6 +427,51 @@ class PageCache:
             yield session
 
 
+def engine_options(
+    url: str,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    max_overflow: int = DEFAULT_MAX_OVERFLOW,
+    pool_pre_ping: bool = True,
+    pool_recycle: Optional[int] = DEFAULT_POOL_RECYCLE,
+    statement_cache_size: Optional[int] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """Work out the engine URL and `create_async_engine` arguments for a cache.
+
+    SQLite always shares one connection. Postgres gets a persistent pool
+    unless pool_size is 0.
+
+    Returns:
+        The (possibly updated) URL and the keyword arguments for the engine
+    """
+    engine_args: Dict[str, Any] = {}
+    if url.startswith("postgresql"):
+        if pool_size < 0 or max_overflow < 0:
+            raise ValueError(
+                f"pool_size and max_overflow must be non-negative, got: "
+                f"{pool_size}, {max_overflow}"
+            )
+        if pool_size == 0:
+            engine_args["poolclass"] = NullPool
+        else:
+            engine_args["pool_size"] = pool_size
+            engine_args["max_overflow"] = max_overflow
+            engine_args["pool_pre_ping"] = pool_pre_ping
+            if pool_recycle is not None:
+                engine_args["pool_recycle"] = pool_recycle
+        if statement_cache_size is not None and url.startswith("postgresql+asyncpg"):
+            url = (
+                make_url(url)
+                .update_query_dict(
+                    {"prepared_statement_cache_size": str(statement_cache_size)}
+                )
+                .render_as_string(hide_password=False)
+            )
+    elif url.startswith("sqlite+aiosqlite://"):
+        engine_args["poolclass"] = StaticPool
+        engine_args["connect_args"] = {"check_same_thread": False}
+    return url, engine_args
+
+
 class QueryBuilder(Generic[P]):
     """Fluent interface for building page queries."""
 
@@ -224,34 +481,139 @@ class QueryBuilder(Generic[P]):
         query_engine: PageQuery,
         validator: PageValidator,
         storage: PageStorage,
+        max_concurrency: int = DEFAULT_VALIDATION_CONCURRENCY,
     ) -> None:
         self._page_type = page_type
         self._query_engine = query_engine
         self._validator = validator
         self._storage = storage
         self._filters: List[Callable[[Any], Any]] = []
+        self._order_by: List[Any] = []
+        self._limit: Optional[int] = None
+        self._offset: Optional[int] = None
+        self._max_concurrency = max_concurrency
 
     def where(self, condition: Callable[[Any], Any]) -> "QueryBuilder[P]":
         """Add a WHERE condition to the query."""
         self._filters.append(condition)
         return self
 
+    def order_by(self, *clauses: Any) -> "QueryBuilder[P]":
+        """Add ORDER BY clauses, given like `where` conditions.
+
+        Example:
+            cache.find(PersonPage).order_by(lambda t: t.full_name)
+        """
+        self._order_by.extend(clauses)
+        return self
+
+    def limit(self, count: int) -> "QueryBuilder[P]":
+        """Fetch at most `count` rows.
+
+        The limit applies in SQL, before validation, so fewer pages may be
+        returned if some of the fetched rows fail validation.
+        """
+        if count < 0:
+            raise ValueError(f"limit must be non-negative, got: {count}")
+        self._limit = count
+        return self
+
+    def offset(self, count: int) -> "QueryBuilder[P]":
+        """Skip the first `count` rows."""
+        if count < 0:
+            raise ValueError(f"offset must be non-negative, got: {count}")
+        self._offset = count
+        return self
+
+    def max_concurrency(self, limit: int) -> "QueryBuilder[P]":
+        """Set how many validator calls may run at the same time."""
+        if limit <= 0:
+            raise ValueError(f"max_concurrency must be positive, got: {limit}")
+        self._max_concurrency = limit
+        return self
+
     async def all(self) -> List[P]:
-        """Execute query and return all matching valid pages."""
-        pages = await self._query_engine.find(self._page_type, self._filters)
-        valid_pages: List[P] = []
-        for page in pages:
-            if await self._validator.is_valid(page):
-                valid_pages.append(page)
-            else:
-                await self._storage.mark_invalid(page.uri)
+        """Execute query and return all matching valid pages.
+
+        Pages are validated concurrently, bounded by max_concurrency. Pages
+        that fail validation are invalidated together in one bulk UPDATE.
+        """
+        return await self._validate_all(await self._find(self._limit))
+
+    async def stream(self, batch_size: int = 100) -> AsyncIterator[P]:
+        """Execute query and yield matching valid pages incrementally.
+
+        Rows are fetched batch_size at a time through a server-side cursor,
+        and each batch is validated like `all()` before its pages are yielded,
+        so whole tables can be scanned in constant memory.
+
+        Example:
+            async for person in cache.find(PersonPage).stream(batch_size=500):
+                ...
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got: {batch_size}")
+        batches = self._query_engine.stream(
+            self._page_type,
+            self._filters,
+            batch_size,
+            order_by=self._order_by,
+            limit=self._limit,
+            offset=self._offset,
+        )
+        async for batch in batches:
+            for page in await self._validate_all(batch):
+                yield page
+
+    async def _find(self, limit: Optional[int]) -> List[P]:
+        """Fetch matching rows, before validation."""
+        return await self._query_engine.find(
+            self._page_type,
+            self._filters,
+            order_by=self._order_by,
+            limit=limit,
+            offset=self._offset,
+        )
+
+    async def _validate_all(self, pages: List[P]) -> List[P]:
+        """Validate pages concurrently, returning the valid ones in order."""
+        if not pages or not self._validator.has_validator(self._page_type):
+            return pages
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def check(page: P) -> bool:
+            async with semaphore:
+                return await self._validator.is_valid(page)
+
+        checks = await asyncio.gather(*(check(page) for page in pages))
+        valid_pages = [page for page, is_valid in zip(pages, checks) if is_valid]
+        invalid_uris = [
+            page.uri for page, is_valid in zip(pages, checks) if not is_valid
+        ]
+        if invalid_uris:
+            await self._storage.mark_invalid_many(self._page_type, invalid_uris)
         return valid_pages
 
     async def first(self) -> Optional[P]:
         """Execute query and return first matching valid page."""
-        results = await self.all()
+        limit = self._limit
+        if not self._validator.has_validator(self._page_type):
+            # Nothing can be rejected after the fetch, so one row is enough
+            limit = 1 if limit is None else min(limit, 1)
+        results = await self._validate_all(await self._find(limit))
         return results[0] if results else None
 
-    async def count(self) -> int:
-        """Count matching valid pages"""
-        return len(await self.all())
+    async def count(self, validate: bool = True) -> int:
+        """Count matching valid pages.
+
+        Args:
+            validate: If True and a validator is registered for the page type,
+                run it over every matching page and count the ones that pass.
+                Otherwise count rows currently marked valid with a single
+                SELECT COUNT(*), without loading any pages. limit and offset
+                are ignored on the COUNT(*) path.
+        """
+        if validate and self._validator.has_validator(self._page_type):
+            return len(await self.all())
+        return await self._query_engine.count(self._page_type, self._filters)
@@ -0,0 +1,124 @@
+"""In-process memory tier that sits in front of the SQL page storage."""
+
+import logging
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+from ..types import Page, PageURI
+
+logger = logging.getLogger(__name__)
+
+P = TypeVar("P", bound=Page)
+
+__all__ = ["PageMemoryCache"]
+
+
+class PageMemoryCache:
+    """LRU cache of hydrated pages keyed by their fully versioned PageURI.
+
+    Only pages known to be valid are held here. Entries are evicted in
+    least-recently-used order once either the entry count or the approximate
+    byte size bound is exceeded. Callers always receive a shallow copy so that
+    mutating a returned page never leaks into the cache.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: Optional[int] = None) -> None:
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got: {max_entries}")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got: {max_bytes}")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[PageURI, Tuple[Page, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, page_type: Type[P], uri: PageURI) -> Optional[P]:
+        """Return a cached copy of the page, or None on a miss.
+
+        Unversioned URIs always miss since resolving "latest" needs the database.
+        """
+        if uri.version is None:
+            self.misses += 1
+            return None
+        entry = self._entries.get(uri)
+        page = entry[0] if entry is not None else None
+        if not isinstance(page, page_type):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(uri)
+        self.hits += 1
+        return page.model_copy()
+
+    def put(self, page: Page) -> None:
+        """Insert or refresh a page, evicting older entries as needed."""
+        if page.uri.version is None:
+            return
+        size = _approximate_size(page)
+        if self._max_bytes is not None and size > self._max_bytes:
+            # Never let a single oversized page flush the whole tier
+            return
+        self.evict(page.uri)
+        self._entries[page.uri] = (page.model_copy(), size)
+        self._total_bytes += size
+        self._enforce_bounds()
+
+    def evict(self, uri: PageURI) -> bool:
+        """Drop a single URI from the cache. Returns True if it was present."""
+        entry = self._entries.pop(uri, None)
+        if entry is None:
+            return False
+        self._total_bytes -= entry[1]
+        return True
+
+    def evict_prefix(self, uri_prefix: str) -> int:
+        """Drop every cached version of a URI prefix."""
+        matching = [uri for uri in self._entries if uri.prefix == uri_prefix]
+        for uri in matching:
+            self.evict(uri)
+        return len(matching)
+
+    def clear(self) -> None:
+        """Drop all entries. Counters are kept."""
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the cache counters and current occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_entries": self._max_entries,
+            "max_bytes": self._max_bytes,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, uri: object) -> bool:
+        return uri in self._entries
+
+    def _enforce_bounds(self) -> None:
+        while len(self._entries) > self._max_entries or (
+            self._max_bytes is not None and self._total_bytes > self._max_bytes
+        ):
+            uri, (_, size) = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            logger.debug(f"Evicted page from memory cache: {uri}")
+
+
+def _approximate_size(page: Page) -> int:
+    """Approximate the in-memory footprint of a page by its JSON size."""
+    try:
+        return len(page.model_dump_json())
+    except Exception:
+        return sys.getsizeof(page.__dict__)
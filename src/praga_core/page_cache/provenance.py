@@ -1,9 +1,9 @@
 """Simplified provenance tracking for page relationships."""
 
 import logging
-from typing import List, Optional, Set
+from typing import List, Optional, Sequence, Set, cast
 
-from sqlalchemy import select
+from sqlalchemy import String, Table, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ..types import Page, PageURI
@@ -14,6 +14,9 @@ from .storage import PageStorage
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on parent hops followed when walking a lineage chain
+MAX_LINEAGE_DEPTH = 256
+
 
 class ProvenanceManager:
     """Handles provenance tracking and relationship validation."""
@@ -38,60 +41,94 @@ class ProvenanceManager:
         Raises:
             ProvenanceError: If the relationship is invalid
         """
-        await self._validate_parent_exists(parent_uri)
-        await self._validate_child_not_exists(page.uri)
-        await self._validate_page_types(page, parent_uri)
+        # Child uniqueness is enforced by PageStorage when the page is written
         await self._validate_parent_version(parent_uri)
+        parent_page = await self._validate_parent_exists(parent_uri)
+        self._validate_page_types(page, parent_page)
         await self._check_for_cycles(page.uri, parent_uri)
 
-    async def _validate_parent_exists(self, parent_uri: PageURI) -> None:
-        """Check if parent page exists in any registered type."""
-        for page_type in self._registry.registered_types:
-            try:
-                page = await self._storage.get(
-                    page_type, parent_uri, ignore_validity=True
-                )
-                if page is not None:
-                    return
-            except Exception:
-                continue
-
-        raise ProvenanceError(f"Parent page {parent_uri} does not exist in cache")
-
-    async def _validate_child_not_exists(self, child_uri: PageURI) -> None:
-        """Check that child page doesn't already exist."""
-        for page_type in self._registry.registered_types:
-            try:
-                page = await self._storage.get(
-                    page_type, child_uri, ignore_validity=True
+    async def validate_relationships(
+        self, pages: Sequence[Page], parent_uri: PageURI
+    ) -> None:
+        """Validate that every page in a batch can have the same parent.
+
+        Parent-level checks (existence, version and the ancestor chain used
+        for cycle detection) run once for the whole batch instead of once per
+        page.
+
+        Raises:
+            ProvenanceError: If any relationship is invalid
+        """
+        await self._validate_parent_version(parent_uri)
+        parent_page = await self._validate_parent_exists(parent_uri)
+
+        ancestor_prefixes = await self._ancestor_prefixes(parent_uri)
+        for page in pages:
+            self._validate_page_types(page, parent_page)
+            if page.uri.prefix in ancestor_prefixes:
+                raise ProvenanceError(
+                    f"Adding relationship {page.uri} -> {parent_uri} would create a cycle"
                 )
-                if page is not None:
+
+    async def _ancestor_prefixes(self, uri: PageURI) -> Set[str]:
+        """Collect the URI prefixes of a page and all of its ancestors."""
+        return {ancestor.prefix for ancestor in await self._ancestor_chain(uri)}
+
+    async def _ancestor_chain(self, uri: PageURI) -> List[PageURI]:
+        """Get the URIs from a page up to its root with one recursive query.
+
+        The walk over `page_relationships` is a single `WITH RECURSIVE` query
+        (supported by both SQLite and Postgres), bounded by
+        MAX_LINEAGE_DEPTH so that a corrupted, cyclic chain still terminates.
+
+        Returns:
+            URIs ordered from the given page to the root
+
+        Raises:
+            ProvenanceError: If the chain contains a cycle
+        """
+        relationships = cast(Table, PageRelationships.__table__)
+        chain = select(
+            literal(str(uri), String).label("uri"),
+            literal(0).label("depth"),
+        ).cte("lineage", recursive=True)
+        chain = chain.union_all(
+            select(relationships.c.target_uri, chain.c.depth + 1).where(
+                relationships.c.source_uri == chain.c.uri,
+                relationships.c.relationship_type == "parent",
+                chain.c.depth < MAX_LINEAGE_DEPTH,
+            )
+        )
+
+        async with self._session_factory() as session:
+            result = await session.execute(select(chain.c.uri).order_by(chain.c.depth))
+            uri_strings = [str(row[0]) for row in result.all()]
+
+        if len(set(uri_strings)) != len(uri_strings):
+            seen: Set[str] = set()
+            for uri_str in uri_strings:
+                if uri_str in seen:
                     raise ProvenanceError(
-                        f"Child page {child_uri} already exists in cache"
+                        f"Cycle detected in parent chain at {uri_str}"
                     )
-            except Exception:
-                continue
+                seen.add(uri_str)
+        return [PageURI.parse(uri_str) for uri_str in uri_strings]
 
-    async def _validate_page_types(self, page: Page, parent_uri: PageURI) -> None:
+    async def _validate_parent_exists(self, parent_uri: PageURI) -> Page:
+        """Check that the parent page exists, returning it."""
+        parent_page = await self._storage.get_by_uri(parent_uri, ignore_validity=True)
+        if parent_page is None:
+            raise ProvenanceError(f"Parent page {parent_uri} does not exist in cache")
+        return parent_page
+
+    def _validate_page_types(self, page: Page, parent_page: Page) -> None:
         """Check that child and parent are not the same page type."""
-        parent_page = None
-        for page_type in self._registry.registered_types:
-            try:
-                parent_page = await self._storage.get(
-                    page_type, parent_uri, ignore_validity=True
-                )
-                if parent_page is not None:
-                    break
-            except Exception:
-                continue
-
-        if parent_page is not None:
-            parent_type = parent_page.__class__.__name__
-            child_type = page.__class__.__name__
-            if parent_type == child_type:
-                raise ProvenanceError(
-                    f"Parent and child cannot be the same page type: {parent_type}"
-                )
+        parent_type = parent_page.__class__.__name__
+        child_type = page.__class__.__name__
+        if parent_type == child_type:
+            raise ProvenanceError(
+                f"Parent and child cannot be the same page type: {parent_type}"
+            )
 
     async def _validate_parent_version(self, parent_uri: PageURI) -> None:
         """Check parent has valid version."""
@@ -102,43 +139,13 @@ class ProvenanceManager:
 
     async def _check_for_cycles(self, child_uri: PageURI, parent_uri: PageURI) -> None:
         """Check that adding this relationship would not create a cycle."""
-        # Start from the proposed parent and walk up the chain
-        current_uri: Optional[PageURI] = parent_uri
-        visited_uris: Set[str] = set()
-
-        while current_uri:
-            # Check if we've reached the proposed child - this would create a cycle
-            if current_uri.prefix == child_uri.prefix:
-                raise ProvenanceError(
-                    f"Adding relationship {child_uri} -> {parent_uri} would create a cycle"
-                )
-
-            # Check if we've already visited this URI - this would indicate a cycle
-            uri_str = str(current_uri)
-            if uri_str in visited_uris:
-                raise ProvenanceError(
-                    f"Cycle detected in parent chain at {current_uri}"
-                )
-            visited_uris.add(uri_str)
-
-            # Find the parent of the current URI
-            async with self._session_factory() as session:
-                result = await session.execute(
-                    select(PageRelationships).where(
-                        PageRelationships.source_uri == str(current_uri),
-                        PageRelationships.relationship_type == "parent",
-                    )
-                )
-                parent_relationship = result.scalar_one_or_none()
-                if parent_relationship:
-                    current_uri = PageURI.parse(str(parent_relationship.target_uri))
-                else:
-                    current_uri = None
+        if child_uri.prefix in await self._ancestor_prefixes(parent_uri):
+            raise ProvenanceError(
+                f"Adding relationship {child_uri} -> {parent_uri} would create a cycle"
+            )
 
     async def get_children(self, parent_uri: PageURI) -> List[Page]:
         """Get all child pages for a given parent."""
-        children = []
-
         async with self._session_factory() as session:
             result = await session.execute(
                 select(PageRelationships).where(
@@ -148,27 +155,20 @@ class ProvenanceManager:
             )
             child_relationships = result.scalars().all()
 
-            for relationship in child_relationships:
-                child_uri = PageURI.parse(str(relationship.source_uri))
-                # Try to get the child page by iterating through registered types
-                for page_type in self._registry.registered_types:
-                    try:
-                        page = await self._storage.get(
-                            page_type, child_uri, ignore_validity=True
-                        )
-                        if page is not None:
-                            children.append(page)
-                            break
-                    except Exception:
-                        continue
-
-        return children
+        child_uris = [
+            PageURI.parse(str(relationship.source_uri))
+            for relationship in child_relationships
+        ]
+        pages = await self._storage.get_many_by_uri(child_uris, ignore_validity=True)
+        return [pages[uri] for uri in child_uris if uri in pages]
 
     async def get_lineage(self, page_uri: PageURI) -> List[Page]:
         """Get the lineage chain from root to the specified page as Page objects.
 
         Returns the pages in order from root to child. Since cycles are prevented
         during relationship creation, this is guaranteed to be a linear chain.
+        The chain is resolved with one recursive query, and the pages are then
+        fetched in one batch per page type.
 
         Args:
             page_uri: The URI of the page to get lineage for
@@ -176,29 +176,9 @@ class ProvenanceManager:
         Returns:
             List of pages in order from root to child
         """
-        lineage = []
-        current_uri: Optional[PageURI] = page_uri
-
-        while current_uri:
-            # Try to find the page of this URI in any registered type
-            page = await self._find_page_by_uri(current_uri)
-            if page:
-                lineage.append(page)
-
-            async with self._session_factory() as session:
-                result = await session.execute(
-                    select(PageRelationships).where(
-                        PageRelationships.source_uri == str(current_uri),
-                        PageRelationships.relationship_type == "parent",
-                    )
-                )
-                parent_relationship = result.scalar_one_or_none()
-                if parent_relationship:
-                    current_uri = PageURI.parse(str(parent_relationship.target_uri))
-                else:
-                    current_uri = None
-
-        return list(reversed(lineage))
+        chain = await self._ancestor_chain(page_uri)
+        pages = await self._storage.get_many_by_uri(chain, ignore_validity=True)
+        return [pages[uri] for uri in reversed(chain) if uri in pages]
 
     async def _find_page_by_uri(self, uri: PageURI) -> Optional[Page]:
         """Find a page by URI across all registered types.
@@ -209,12 +189,4 @@ class ProvenanceManager:
         Returns:
             The page if found, None otherwise
         """
-        for page_type in self._registry.registered_types:
-            try:
-                await self._registry.ensure_registered(page_type)
-                page = await self._storage.get(page_type, uri, ignore_validity=True)
-                if page is not None:
-                    return page
-            except Exception:
-                continue
-        return None
+        return await self._storage.get_by_uri(uri, ignore_validity=True)
@@ -1,14 +1,14 @@
 """Page query building and execution."""
 
 import logging
-from typing import Any, Callable, List, Type, TypeVar
+from typing import Any, AsyncIterator, Callable, List, Optional, Type, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import sessionmaker
 
 from ..types import Page
 from .registry import PageRegistry
-from .serialization import deserialize_from_storage
+from .serialization import entity_to_page
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +23,21 @@ class PageQuery:
         self._registry = registry
 
     async def find(
-        self, page_type: Type[P], filters: List[Callable[[Any], Any]]
+        self,
+        page_type: Type[P],
+        filters: List[Callable[[Any], Any]],
+        order_by: Optional[List[Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ) -> List[P]:
         """Find pages matching the given filters (async).
 
         Args:
             page_type: The type of pages to search for
             filters: List of filter functions that take the table class and return filter expressions
+            order_by: Optional ordering clauses, given like filters
+            limit: Maximum number of rows to fetch
+            offset: Number of rows to skip
 
         Returns:
             List of matching pages (includes invalid pages - caller should validate)
@@ -41,20 +49,7 @@ class PageQuery:
             return []
 
         async with self._session_factory() as session:
-            query = select(table_class)
-
-            # Apply all filters
-            for filter_func in filters:
-                if callable(filter_func):
-                    filter_expr = filter_func(table_class)
-                    query = query.filter(filter_expr)
-                else:
-                    # Direct SQLAlchemy expression
-                    query = query.filter(filter_func)
-
-            # Only return valid pages at the database level
-            query = query.filter(table_class.valid.is_(True))
-
+            query = self._select_pages(table_class, filters, order_by, limit, offset)
             result = await session.execute(query)
             entities = result.scalars().all()
 
@@ -70,17 +65,100 @@ class PageQuery:
 
             return results
 
-    def _entity_to_page(self, entity: Any, page_type: Type[P]) -> P:
-        """Convert database entity back to Page instance."""
-        from ..types import PageURI
+    async def stream(
+        self,
+        page_type: Type[P],
+        filters: List[Callable[[Any], Any]],
+        batch_size: int,
+        order_by: Optional[List[Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> AsyncIterator[List[P]]:
+        """Stream pages matching the given filters in batches (async).
+
+        Rows are read through a server-side cursor where the database supports
+        it, so at most one batch of pages is held in memory at a time.
+
+        Yields:
+            Lists of at most batch_size pages (includes invalid pages - caller should validate)
+        """
+        try:
+            table_class = self._registry.get_table_class(page_type)
+        except ValueError:
+            # Page type not registered
+            return
+
+        query = self._select_pages(
+            table_class, filters, order_by, limit, offset
+        ).execution_options(yield_per=batch_size)
 
-        full_uri_string = f"{entity.uri_prefix}@{entity.version}"
-        page_data = {"uri": PageURI.parse(full_uri_string)}
+        async with self._session_factory() as session:
+            result = await session.stream_scalars(query)
+            async for entities in result.partitions(batch_size):
+                batch = []
+                for entity in entities:
+                    try:
+                        batch.append(self._entity_to_page(entity, page_type))
+                    except Exception as e:
+                        logger.warning(f"Failed to convert entity to page: {e}")
+                if batch:
+                    yield batch
+
+    async def count(
+        self, page_type: Type[P], filters: List[Callable[[Any], Any]]
+    ) -> int:
+        """Count pages matching the given filters with SELECT COUNT(*) (async).
+
+        Only rows currently marked valid are counted; validators are not run.
+        """
+        try:
+            table_class = self._registry.get_table_class(page_type)
+        except ValueError:
+            # Page type not registered
+            return 0
 
-        for field_name, field_info in page_type.model_fields.items():
-            if field_name != "uri":
-                value = getattr(entity, field_name)
-                converted_value = deserialize_from_storage(value, field_info.annotation)
-                page_data[field_name] = converted_value
+        async with self._session_factory() as session:
+            query = self._apply_filters(
+                select(func.count()).select_from(table_class), table_class, filters
+            )
+            result = await session.execute(query)
+            return int(result.scalar_one())
+
+    def _select_pages(
+        self,
+        table_class: Any,
+        filters: List[Callable[[Any], Any]],
+        order_by: Optional[List[Any]],
+        limit: Optional[int],
+        offset: Optional[int],
+    ) -> Any:
+        """Build the SELECT for a page query, including ordering and paging."""
+        query = self._apply_filters(select(table_class), table_class, filters)
+        for clause in order_by or []:
+            query = query.order_by(self._resolve(clause, table_class))
+        if limit is not None:
+            query = query.limit(limit)
+        if offset is not None:
+            query = query.offset(offset)
+        return query
+
+    def _apply_filters(
+        self, query: Any, table_class: Any, filters: List[Callable[[Any], Any]]
+    ) -> Any:
+        """Apply the caller's filters plus the validity filter to a query."""
+        for filter_func in filters:
+            query = query.filter(self._resolve(filter_func, table_class))
+
+        # Only return valid pages at the database level
+        return query.filter(table_class.valid.is_(True))
+
+    def _resolve(self, clause: Any, table_class: Any) -> Any:
+        """Resolve a clause given either as a function of the table or directly."""
+        if callable(clause):
+            return clause(table_class)
+        # Direct SQLAlchemy expression
+        return clause
 
-        return page_type(**page_data)
+    def _entity_to_page(self, entity: Any, page_type: Type[P]) -> P:
+        """Convert database entity back to Page instance."""
+        return entity_to_page(entity, page_type)
@@ -1,13 +1,20 @@
 """Page type registration and table management."""
 
 import logging
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Type, cast
 
+from sqlalchemy import Insert, Table, exists, insert, literal, select
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from ..types import Page
-from .schema import clear_table_registry, create_page_table, get_table_registry
+from .schema import (
+    PageIndex,
+    add_missing_columns,
+    clear_table_registry,
+    create_page_table,
+    get_table_registry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +45,14 @@ class PageRegistry:
         # Use AsyncConnection.run_sync to run the synchronous create_all method
         async with self._engine.begin() as conn:
             await conn.run_sync(table_class.metadata.create_all, checkfirst=True)
+            await conn.run_sync(add_missing_columns, table_class.__table__)
+            await conn.run_sync(
+                lambda sync_conn: cast(Table, PageIndex.__table__).create(
+                    sync_conn, checkfirst=True
+                )
+            )
+            # Backfill the page index for rows written before it existed
+            await conn.execute(_backfill_index_statement(table_class, type_name))
 
         self._registered_types.add(type_name)
         self._page_classes[type_name] = page_type
@@ -75,3 +90,18 @@ class PageRegistry:
         self._registered_types.clear()
         self._page_classes.clear()
         logger.debug("Cleared page type registry")
+
+
+def _backfill_index_statement(table_class: Any, type_name: str) -> Insert:
+    """Build an INSERT ... SELECT adding missing page index rows for a table."""
+    index_table = cast(Table, PageIndex.__table__)
+    already_indexed = exists().where(
+        index_table.c.uri_prefix == table_class.uri_prefix,
+        index_table.c.page_type == type_name,
+    )
+    missing = (
+        select(table_class.uri_prefix, literal(type_name))
+        .where(~already_indexed)
+        .distinct()
+    )
+    return insert(index_table).from_select(["uri_prefix", "page_type"], missing)
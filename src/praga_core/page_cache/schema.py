@@ -15,8 +15,12 @@ from sqlalchemy import (
     Integer,
     Numeric,
     String,
+    Table,
     Text,
+    inspect,
+    text,
 )
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm.decl_api import DeclarativeBase
 
 from ..types import Page, PageURI
@@ -61,6 +65,20 @@ class PageRelationships(Base):
     )
 
 
+class PageIndex(Base):
+    """Table mapping each URI prefix to the page type(s) that own it.
+
+    This lets cross-type lookups (provenance checks, invalidation by URI)
+    resolve the owning table with a single indexed probe instead of querying
+    every registered page table in turn.
+    """
+
+    __tablename__ = "page_index"
+
+    uri_prefix = Column(String, primary_key=True)
+    page_type = Column(String, primary_key=True)
+
+
 def get_base_type(field_type: Any) -> Any:
     """Extract the base type from a complex type annotation.
 
@@ -254,6 +272,8 @@ def create_page_table(page_class: Type[P]) -> Any:
             default=lambda: datetime.now(timezone.utc),
             onupdate=lambda: datetime.now(timezone.utc),
         ),
+        # Last time the page passed its validator, used for validation TTLs
+        "validated_at": Column(TIMESTAMP(timezone=True), nullable=True),
         "_schema_signature": get_page_schema_signature(page_class),
     }
 
@@ -279,6 +299,28 @@ def create_page_table(page_class: Type[P]) -> Any:
     return table_class
 
 
+# Bookkeeping columns added after the first release. Tables created by older
+# versions are upgraded in place by `add_missing_columns`.
+_UPGRADABLE_COLUMNS = ("validated_at",)
+
+
+def add_missing_columns(sync_conn: Connection, table: Table) -> None:
+    """Add bookkeeping columns that are missing from an existing page table.
+
+    `create_all` never alters existing tables, so page tables created before a
+    bookkeeping column was introduced are upgraded here with ALTER TABLE.
+    """
+    existing = {column["name"] for column in inspect(sync_conn).get_columns(table.name)}
+    for column_name in _UPGRADABLE_COLUMNS:
+        if column_name in existing or column_name not in table.columns:
+            continue
+        column_type = table.columns[column_name].type.compile(dialect=sync_conn.dialect)
+        sync_conn.execute(
+            text(f"ALTER TABLE {table.name} ADD COLUMN {column_name} {column_type}")
+        )
+        logger.info(f"Added missing column {column_name} to {table.name}")
+
+
 def clear_table_registry() -> None:
     """Clear the global table registry."""
     _TABLE_REGISTRY.clear()
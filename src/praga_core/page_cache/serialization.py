@@ -1,12 +1,15 @@
 """Serialization utilities for converting complex objects to/from database storage."""
 
-from typing import Any, get_args, get_origin
+from datetime import timezone
+from typing import Any, Type, TypeVar, get_args, get_origin
 
 from pydantic import BaseModel
 
-from ..types import PageURI
+from ..types import Page, PageURI
 from .schema import get_base_type
 
+P = TypeVar("P", bound=Page)
+
 
 def serialize_for_storage(value: Any) -> Any:
     """Convert complex objects to JSON-serializable formats for database storage.
@@ -35,6 +38,30 @@ def serialize_for_storage(value: Any) -> Any:
         return value
 
 
+def entity_to_page(entity: Any, page_type: Type[P]) -> P:
+    """Convert a database entity back into a Page instance.
+
+    Bookkeeping columns that are not Page fields (such as the last validation
+    time) are surfaced through the page's metadata.
+    """
+    full_uri_string = f"{entity.uri_prefix}@{entity.version}"
+    page_data: dict[str, Any] = {"uri": PageURI.parse(full_uri_string)}
+    for field_name, field_info in page_type.model_fields.items():
+        if field_name != "uri":
+            value = getattr(entity, field_name)
+            page_data[field_name] = deserialize_from_storage(
+                value, field_info.annotation
+            )
+    page = page_type(**page_data)
+
+    validated_at = getattr(entity, "validated_at", None)
+    if validated_at is not None and validated_at.tzinfo is None:
+        # SQLite drops timezone information; timestamps are stored in UTC
+        validated_at = validated_at.replace(tzinfo=timezone.utc)
+    page.metadata.validated_at = validated_at
+    return page
+
+
 def deserialize_from_storage(value: Any, field_type: Any) -> Any:
     """Convert stored values back to their original types after database retrieval.
 
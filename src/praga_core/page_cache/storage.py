@@ -1,16 +1,21 @@
 """Core storage operations for pages (async version)."""
 
 import logging
-from typing import Any, Optional, Type, TypeVar
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, cast
 
-from sqlalchemy import select, update
+from sqlalchemy import func, insert, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ..types import Page, PageURI
+from .memory import PageMemoryCache
 from .registry import PageRegistry
-from .schema import PageRelationships
-from .serialization import deserialize_from_storage, serialize_for_storage
+from .schema import PageIndex, PageRelationships
+from .serialization import entity_to_page, serialize_for_storage
 
 logger = logging.getLogger(__name__)
 
@@ -21,10 +26,19 @@ class PageStorage:
     """Handles core CRUD operations for pages (async)."""
 
     def __init__(
-        self, session_factory: async_sessionmaker[AsyncSession], registry: PageRegistry
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        registry: PageRegistry,
+        memory_cache: Optional[PageMemoryCache] = None,
     ):
         self._session_factory = session_factory
         self._registry = registry
+        self._memory_cache = memory_cache
+
+    @property
+    def memory_cache(self) -> Optional[PageMemoryCache]:
+        """The in-process page tier, if one is configured."""
+        return self._memory_cache
 
     async def store(self, page: Page, parent_uri: Optional[PageURI] = None) -> bool:
         """Store a page with optional parent relationship.
@@ -36,6 +50,8 @@ class PageStorage:
 
         await self._registry.ensure_registered(page.__class__)
         table_class = self._registry.get_table_class(page.__class__)
+        if self._memory_cache is not None:
+            self._memory_cache.evict(page.uri)
 
         async with self._session_factory() as session:
             # Check if page already exists
@@ -58,20 +74,9 @@ class PageStorage:
                 )
 
             # Create new page record
-            page_data = {
-                "uri_prefix": page.uri.prefix,
-                "version": page.uri.version,
-                "valid": True,
-            }
-
-            # Serialize all fields except uri
-            for field_name in page.__class__.model_fields:
-                if field_name != "uri":
-                    value = getattr(page, field_name)
-                    page_data[field_name] = serialize_for_storage(value)
-
-            page_entity = table_class(**page_data)
+            page_entity = table_class(**self._page_to_row(page))
             session.add(page_entity)
+            await self._index_pages(session, [page])
             logger.debug(f"[STORE] Added new page entity: {page.uri}")
 
             # Add parent relationship if specified (in same transaction)
@@ -96,6 +101,80 @@ class PageStorage:
                 logger.debug(f"[STORE] Rollback due to integrity error: {page.uri}")
                 return False
 
+    async def store_many(
+        self, pages: Sequence[Page], parent_uri: Optional[PageURI] = None
+    ) -> List[bool]:
+        """Store many pages in a single transaction.
+
+        Pages are grouped by table and written with one multi-row INSERT per
+        table, together with their parent relationships. Pages that already
+        exist are skipped rather than raising.
+
+        Returns a list aligned with `pages`: True if the page was newly
+        created, False if it already existed.
+        """
+        if not pages:
+            return []
+        for page in pages:
+            if page.uri.version is None:
+                raise ValueError("Cannot store page with None version")
+
+        by_table: Dict[Any, List[Tuple[int, Page]]] = {}
+        for index, page in enumerate(pages):
+            await self._registry.ensure_registered(page.__class__)
+            table_class = self._registry.get_table_class(page.__class__)
+            by_table.setdefault(table_class, []).append((index, page))
+            if self._memory_cache is not None:
+                self._memory_cache.evict(page.uri)
+
+        created = [False] * len(pages)
+        async with self._session_factory() as session:
+            await self._index_pages(session, pages)
+            relationship_rows: List[Dict[str, Any]] = []
+            for table_class, table_pages in by_table.items():
+                keys = {(page.uri.prefix, page.uri.version) for _, page in table_pages}
+                result = await session.execute(
+                    select(table_class.uri_prefix, table_class.version).where(
+                        tuple_(table_class.uri_prefix, table_class.version).in_(
+                            list(keys)
+                        )
+                    )
+                )
+                existing = {(row[0], row[1]) for row in result.all()}
+
+                rows: List[Dict[str, Any]] = []
+                for index, page in table_pages:
+                    key = (page.uri.prefix, page.uri.version)
+                    if key in existing:
+                        continue
+                    # Guard against duplicates within the same batch
+                    existing.add(key)
+                    created[index] = True
+                    rows.append(self._page_to_row(page))
+
+                    effective_parent = parent_uri or page.parent_uri
+                    if effective_parent:
+                        relationship_rows.append(
+                            {
+                                "source_uri": str(page.uri),
+                                "relationship_type": "parent",
+                                "target_uri": str(effective_parent),
+                            }
+                        )
+                if rows:
+                    await session.execute(insert(table_class), rows)
+
+            if relationship_rows:
+                await session.execute(insert(PageRelationships), relationship_rows)
+
+            await session.commit()
+
+        logger.debug(
+            f"[STORE_MANY] Stored {sum(created)} new pages, "
+            f"{len(pages) - sum(created)} already existed"
+        )
+        return created
+
     async def get(
         self, page_type: Type[P], uri: PageURI, ignore_validity: bool = False
     ) -> Optional[P]:
@@ -108,6 +187,14 @@ class PageStorage:
             logger.debug(f"[GET] Page type not registered: {page_type}")
             return None
 
+        # The memory tier only ever holds valid pages, so a hit satisfies
+        # both validity modes
+        if self._memory_cache is not None:
+            cached = self._memory_cache.get(page_type, uri)
+            if cached is not None:
+                logger.debug(f"[GET] Memory cache hit for {uri}")
+                return cached
+
         async with self._session_factory() as session:
             query = select(table_class).where(table_class.uri_prefix == uri.prefix)
             if uri.version is not None:
@@ -121,10 +208,190 @@ class PageStorage:
             logger.debug(f"[GET] Found: {entity is not None} for {uri}")
             if entity and (ignore_validity or entity.valid):
                 logger.debug(f"[GET] Returning entity for {uri}")
-                return self._entity_to_page(entity, page_type)
+                page = self._entity_to_page(entity, page_type)
+                if entity.valid and self._memory_cache is not None:
+                    self._memory_cache.put(page)
+                return page
             logger.debug(f"[GET] No valid entity for {uri}")
             return None
 
+    async def lookup(
+        self, page_type: Type[P], uri: PageURI, ignore_validity: bool = False
+    ) -> Tuple[Optional[P], Optional[int]]:
+        """Get a page and the latest stored version of its prefix in one query.
+
+        Returns:
+            The page (None if missing or invalid) and the highest stored
+            version of the URI prefix (None if nothing is stored under it).
+            On a memory tier hit the latest version is not looked up.
+        """
+        try:
+            await self._registry.ensure_registered(page_type)
+            table_class = self._registry.get_table_class(page_type)
+        except ValueError:
+            logger.debug(f"[LOOKUP] Page type not registered: {page_type}")
+            return None, None
+
+        if self._memory_cache is not None:
+            cached = self._memory_cache.get(page_type, uri)
+            if cached is not None:
+                logger.debug(f"[LOOKUP] Memory cache hit for {uri}")
+                return cached, None
+
+        latest = (
+            select(func.max(table_class.version))
+            .where(table_class.uri_prefix == uri.prefix)
+            .scalar_subquery()
+        )
+        # At most two rows: the requested version and the latest one
+        query = select(table_class).where(table_class.uri_prefix == uri.prefix)
+        if uri.version is None:
+            query = query.where(table_class.version == latest)
+        else:
+            query = query.where(
+                or_(table_class.version == uri.version, table_class.version == latest)
+            )
+
+        async with self._session_factory() as session:
+            result = await session.execute(query)
+            entities = result.scalars().all()
+
+        latest_version = max((int(e.version) for e in entities), default=None)
+        entity = next(
+            (e for e in entities if uri.version is None or e.version == uri.version),
+            None,
+        )
+        logger.debug(f"[LOOKUP] Found: {entity is not None} for {uri}")
+        if entity is None or not (ignore_validity or entity.valid):
+            return None, latest_version
+        page = self._entity_to_page(entity, page_type)
+        if entity.valid and self._memory_cache is not None:
+            self._memory_cache.put(page)
+        return page, latest_version
+
+    async def store_if_absent(self, page: Page) -> bool:
+        """Store a page unless its URI is already taken, in one round trip.
+
+        Uses `INSERT ... ON CONFLICT DO NOTHING` rather than checking for the
+        row first, so concurrent writers of the same page cannot race.
+
+        Returns True if the page was newly created, False if it already existed.
+        """
+        if page.uri.version is None:
+            raise ValueError("Cannot store page with None version")
+        table_class = self._registry.get_table_class(page.__class__)
+        if self._memory_cache is not None:
+            self._memory_cache.evict(page.uri)
+
+        async with self._session_factory() as session:
+            inserted = await insert_ignoring_conflicts(
+                session, table_class, [self._page_to_row(page)]
+            )
+            if inserted:
+                await self._index_pages(session, [page])
+                if page.parent_uri:
+                    await insert_ignoring_conflicts(
+                        session,
+                        PageRelationships,
+                        [
+                            {
+                                "source_uri": str(page.uri),
+                                "relationship_type": "parent",
+                                "target_uri": str(page.parent_uri),
+                            }
+                        ],
+                    )
+            await session.commit()
+        logger.debug(f"[STORE_IF_ABSENT] Created: {bool(inserted)} for {page.uri}")
+        return bool(inserted)
+
+    async def get_many(
+        self,
+        page_type: Type[P],
+        uris: Sequence[PageURI],
+        ignore_validity: bool = False,
+    ) -> Dict[PageURI, P]:
+        """Get many pages of one type with at most two queries (async).
+
+        Versioned URIs are resolved with a single `(uri_prefix, version) IN`
+        query. Unversioned URIs resolve to their highest stored version with a
+        single grouped query, matching the semantics of `get`.
+
+        Returns a mapping from each requested URI to its page. URIs with no
+        matching (valid) page are omitted.
+        """
+        try:
+            await self._registry.ensure_registered(page_type)
+            table_class = self._registry.get_table_class(page_type)
+        except ValueError:
+            logger.debug(f"[GET_MANY] Page type not registered: {page_type}")
+            return {}
+
+        found: Dict[PageURI, P] = {}
+        versioned: List[PageURI] = []
+        unversioned: List[PageURI] = []
+        for uri in dict.fromkeys(uris):
+            if uri.version is None:
+                unversioned.append(uri)
+                continue
+            if self._memory_cache is not None:
+                cached = self._memory_cache.get(page_type, uri)
+                if cached is not None:
+                    found[uri] = cached
+                    continue
+            versioned.append(uri)
+
+        if not versioned and not unversioned:
+            return found
+
+        by_key: Dict[Tuple[str, int], Any] = {}
+        latest_by_prefix: Dict[str, Any] = {}
+        async with self._session_factory() as session:
+            if versioned:
+                result = await session.execute(
+                    select(table_class).where(
+                        tuple_(table_class.uri_prefix, table_class.version).in_(
+                            [(uri.prefix, uri.version) for uri in versioned]
+                        )
+                    )
+                )
+                for entity in result.scalars().all():
+                    by_key[(entity.uri_prefix, entity.version)] = entity
+            if unversioned:
+                latest = (
+                    select(
+                        table_class.uri_prefix,
+                        func.max(table_class.version).label("latest_version"),
+                    )
+                    .where(table_class.uri_prefix.in_([u.prefix for u in unversioned]))
+                    .group_by(table_class.uri_prefix)
+                    .subquery()
+                )
+                result = await session.execute(
+                    select(table_class).join(
+                        latest,
+                        (table_class.uri_prefix == latest.c.uri_prefix)
+                        & (table_class.version == latest.c.latest_version),
+                    )
+                )
+                for entity in result.scalars().all():
+                    latest_by_prefix[entity.uri_prefix] = entity
+
+        for uri in versioned + unversioned:
+            if uri.version is None:
+                entity = latest_by_prefix.get(uri.prefix)
+            else:
+                entity = by_key.get((uri.prefix, uri.version))
+            if entity is None or not (ignore_validity or entity.valid):
+                continue
+            page = self._entity_to_page(entity, page_type)
+            if entity.valid and self._memory_cache is not None:
+                self._memory_cache.put(page)
+            found[uri] = page
+
+        logger.debug(f"[GET_MANY] Found {len(found)} of {len(uris)} for {page_type}")
+        return found
+
     async def get_latest_version(
         self, page_type: Type[P], uri_prefix: str
     ) -> Optional[P]:
@@ -151,8 +418,9 @@ class PageStorage:
 
     async def mark_invalid(self, uri: PageURI) -> bool:
         """Mark a page as invalid (async)."""
-        for page_type in self._registry.registered_types:
-            await self._registry.ensure_registered(page_type)
+        if self._memory_cache is not None:
+            self._memory_cache.evict(uri)
+        for page_type in await self.get_page_types(uri.prefix):
             table_class = self._registry.get_table_class(page_type)
             async with self._session_factory() as session:
                 result = await session.execute(
@@ -169,11 +437,42 @@ class PageStorage:
                     return True
         return False
 
+    async def mark_invalid_many(
+        self, page_type: Type[Page], uris: Sequence[PageURI]
+    ) -> int:
+        """Mark many pages of one type as invalid with a single UPDATE (async).
+
+        Returns the number of rows that were invalidated.
+        """
+        if not uris:
+            return 0
+        if self._memory_cache is not None:
+            for uri in uris:
+                self._memory_cache.evict(uri)
+        table_class = self._registry.get_table_class(page_type)
+        keys = list({(uri.prefix, uri.version) for uri in uris})
+        async with self._session_factory() as session:
+            result = cast(
+                CursorResult[Any],
+                await session.execute(
+                    update(table_class)
+                    .where(
+                        tuple_(table_class.uri_prefix, table_class.version).in_(keys)
+                    )
+                    .values(valid=False)
+                ),
+            )
+            await session.commit()
+        invalidated = result.rowcount
+        logger.debug(f"Marked {invalidated} {page_type.__name__} pages invalid")
+        return invalidated
+
     async def mark_invalid_by_prefix(self, uri_prefix: str) -> int:
         """Mark all versions of a URI prefix as invalid (async)."""
+        if self._memory_cache is not None:
+            self._memory_cache.evict_prefix(uri_prefix)
         total_invalidated = 0
-        for page_type in self._registry.registered_types:
-            await self._registry.ensure_registered(page_type)
+        for page_type in await self.get_page_types(uri_prefix):
             table_class = self._registry.get_table_class(page_type)
             async with self._session_factory() as session:
                 result = await session.execute(
@@ -186,13 +485,150 @@ class PageStorage:
         logger.debug(f"Invalidated {total_invalidated} pages with prefix: {uri_prefix}")
         return total_invalidated
 
+    async def mark_validated(self, page: Page) -> None:
+        """Record that a page just passed validation (async)."""
+        validated_at = datetime.now(timezone.utc)
+        table_class = self._registry.get_table_class(page.__class__)
+        async with self._session_factory() as session:
+            await session.execute(
+                update(table_class)
+                .where(
+                    table_class.uri_prefix == page.uri.prefix,
+                    table_class.version == page.uri.version,
+                )
+                .values(validated_at=validated_at)
+            )
+            await session.commit()
+        page.metadata.validated_at = validated_at
+        if self._memory_cache is not None and page.uri in self._memory_cache:
+            self._memory_cache.put(page)
+
+    async def get_page_types(self, uri_prefix: str) -> List[Type[Page]]:
+        """Look up the registered page type(s) stored under a URI prefix.
+
+        Uses the page index, so this is a single indexed probe regardless of
+        how many page types are registered.
+        """
+        types_by_prefix = await self.get_page_types_many([uri_prefix])
+        return types_by_prefix.get(uri_prefix, [])
+
+    async def get_page_types_many(
+        self, uri_prefixes: Sequence[str]
+    ) -> Dict[str, List[Type[Page]]]:
+        """Look up the registered page types for many URI prefixes at once."""
+        if not uri_prefixes:
+            return {}
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(PageIndex).where(
+                    PageIndex.uri_prefix.in_(list(dict.fromkeys(uri_prefixes)))
+                )
+            )
+            entries = result.scalars().all()
+
+        types_by_prefix: Dict[str, List[Type[Page]]] = {}
+        for entry in entries:
+            try:
+                page_type = self._registry.get_page_class(str(entry.page_type))
+            except ValueError:
+                # Stored by a page type this process has not registered
+                continue
+            types_by_prefix.setdefault(str(entry.uri_prefix), []).append(page_type)
+        return types_by_prefix
+
+    async def get_by_uri(
+        self, uri: PageURI, ignore_validity: bool = False
+    ) -> Optional[Page]:
+        """Get a page by URI without knowing its type, via the page index."""
+        for page_type in await self.get_page_types(uri.prefix):
+            page = await self.get(page_type, uri, ignore_validity=ignore_validity)
+            if page is not None:
+                return page
+        return None
+
+    async def get_many_by_uri(
+        self, uris: Sequence[PageURI], ignore_validity: bool = False
+    ) -> Dict[PageURI, Page]:
+        """Get pages of mixed types by URI with one query per page type."""
+        types_by_prefix = await self.get_page_types_many([uri.prefix for uri in uris])
+        uris_by_type: Dict[Type[Page], List[PageURI]] = {}
+        for uri in uris:
+            for page_type in types_by_prefix.get(uri.prefix, []):
+                uris_by_type.setdefault(page_type, []).append(uri)
+
+        found: Dict[PageURI, Page] = {}
+        for page_type, typed_uris in uris_by_type.items():
+            pages = await self.get_many(
+                page_type, typed_uris, ignore_validity=ignore_validity
+            )
+            for uri, page in pages.items():
+                found.setdefault(uri, page)
+        return found
+
+    async def _index_pages(self, session: AsyncSession, pages: Sequence[Page]) -> None:
+        """Record the owning page type of each page's URI prefix."""
+        rows = {
+            (page.uri.prefix, page.__class__.__name__): {
+                "uri_prefix": page.uri.prefix,
+                "page_type": page.__class__.__name__,
+            }
+            for page in pages
+        }
+        await insert_ignoring_conflicts(session, PageIndex, list(rows.values()))
+
+    def _page_to_row(self, page: Page) -> Dict[str, Any]:
+        """Convert a Page into column values for its table."""
+        page_data = {
+            "uri_prefix": page.uri.prefix,
+            "version": page.uri.version,
+            "valid": True,
+            # A page being stored was just produced from its source
+            "validated_at": datetime.now(timezone.utc),
+        }
+
+        # Serialize all fields except uri
+        for field_name in page.__class__.model_fields:
+            if field_name != "uri":
+                value = getattr(page, field_name)
+                page_data[field_name] = serialize_for_storage(value)
+        return page_data
+
     def _entity_to_page(self, entity: Any, page_type: Type[P]) -> P:
         """Convert database entity back to Page instance."""
-        full_uri_string = f"{entity.uri_prefix}@{entity.version}"
-        page_data = {"uri": PageURI.parse(full_uri_string)}
-        for field_name, field_info in page_type.model_fields.items():
-            if field_name != "uri":
-                value = getattr(entity, field_name)
-                converted_value = deserialize_from_storage(value, field_info.annotation)
-                page_data[field_name] = converted_value
-        return page_type(**page_data)
+        return entity_to_page(entity, page_type)
+
+
+async def insert_ignoring_conflicts(
+    session: AsyncSession, table_class: Any, rows: Sequence[Dict[str, Any]]
+) -> int:
+    """Insert rows, silently skipping any that collide with an existing key.
+
+    Uses the dialect's native `ON CONFLICT DO NOTHING` where available so that
+    concurrent writers cannot race each other into an IntegrityError.
+
+    Returns the number of rows inserted.
+    """
+    if not rows:
+        return 0
+    dialect = session.bind.dialect.name if session.bind is not None else ""
+    if dialect in ("sqlite", "postgresql"):
+        dialect_insert = sqlite_insert if dialect == "sqlite" else postgresql_insert
+        # Insert into the Core table so the driver's row count is reported
+        statement = dialect_insert(table_class.__table__).on_conflict_do_nothing()
+        params = rows[0] if len(rows) == 1 else list(rows)
+        result = cast(CursorResult[Any], await session.execute(statement, params))
+        # Drivers may not report a count for multi-row inserts
+        return result.rowcount if result.rowcount >= 0 else len(rows)
+
+    # Generic fallback: filter out rows whose primary key already exists
+    key_columns = [column.name for column in table_class.__table__.primary_key]
+    key_attrs = [getattr(table_class, name) for name in key_columns]
+    keys = [tuple(row[name] for name in key_columns) for row in rows]
+    result = await session.execute(
+        select(*key_attrs).where(tuple_(*key_attrs).in_(keys))
+    )
+    existing = {tuple(row) for row in result.all()}
+    new_rows = [row for row, key in zip(rows, keys) if key not in existing]
+    if new_rows:
+        await session.execute(insert(table_class), new_rows)
+    return len(new_rows)
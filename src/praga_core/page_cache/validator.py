@@ -1,7 +1,8 @@
 """Page validation logic."""
 
 import logging
-from typing import Awaitable, Callable, Dict, Type, TypeVar
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Optional, Type, TypeVar
 
 from ..types import Page
 
@@ -17,10 +18,19 @@ __all__ = ["PageValidator", "ValidatorFn"]
 class PageValidator:
     """Handles page validation using registered validator functions."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self, on_validated: Optional[Callable[[Page], Awaitable[None]]] = None
+    ) -> None:
         self._validators: Dict[str, ValidatorFn[Page]] = {}
-
-    def register(self, page_type: Type[P], validator: ValidatorFn[P]) -> None:
+        self._ttls: Dict[str, timedelta] = {}
+        self._on_validated = on_validated
+
+    def register(
+        self,
+        page_type: Type[P],
+        validator: ValidatorFn[P],
+        ttl: Optional[timedelta] = None,
+    ) -> None:
         """Register a validator function for a page type.
 
         The validator function should return True if the page is valid,
@@ -28,8 +38,13 @@ class PageValidator:
 
         All validators must be async:
         - async def validator(page: MyPage) -> bool: ...
+
+        If a ttl is given, a page that passed validation within that window
+        is trusted without calling the validator again.
         """
         type_name = page_type.__name__
+        if ttl is not None and ttl <= timedelta(0):
+            raise ValueError(f"Validator ttl must be positive, got: {ttl}")
 
         def type_safe_validator(page: Page) -> Awaitable[bool]:
             """Wrapper that ensures type safety."""
@@ -43,6 +58,10 @@ class PageValidator:
             return validator(page)
 
         self._validators[type_name] = type_safe_validator
+        if ttl is not None:
+            self._ttls[type_name] = ttl
+        else:
+            self._ttls.pop(type_name, None)
         logger.debug(f"Registered validator for page type: {type_name}")
 
     async def is_valid(self, page: Page) -> bool:
@@ -54,12 +73,17 @@ class PageValidator:
         type_name = page.__class__.__name__
 
         if type_name in self._validators:
+            if self.is_fresh(page):
+                logger.debug(f"Page validated within ttl, skipping: {page.uri}")
+                return True
             validator = self._validators[type_name]
             try:
                 is_valid = await validator(page)
 
                 if not is_valid:
                     logger.debug(f"Page failed validation: {page.uri}")
+                elif type_name in self._ttls and self._on_validated is not None:
+                    await self._on_validated(page)
                 return is_valid
             except Exception as e:
                 logger.warning(f"Validator error for {page.uri}: {e}")
@@ -69,6 +93,14 @@ class PageValidator:
         # No validator registered - consider valid by default
         return True
 
+    def is_fresh(self, page: Page) -> bool:
+        """Check if a page passed validation recently enough to be trusted."""
+        ttl = self._ttls.get(page.__class__.__name__)
+        validated_at = page.metadata.validated_at
+        if ttl is None or validated_at is None:
+            return False
+        return datetime.now(timezone.utc) - validated_at < ttl
+
     def has_validator(self, page_type: Type[Page]) -> bool:
         """Check if a validator is registered for a page type."""
         return page_type.__name__ in self._validators
@@ -76,4 +108,5 @@ class PageValidator:
     def clear(self) -> None:
         """Clear all registered validators."""
         self._validators.clear()
+        self._ttls.clear()
         logger.debug("Cleared all page validators")
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 from abc import ABC, abstractmethod
+from datetime import timedelta
 from typing import (
     Any,
     Awaitable,
@@ -9,10 +10,12 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
     get_type_hints,
+    overload,
 )
 
 from praga_core.types import Page, PageURI
@@ -32,6 +35,8 @@ class PageRouterMixin(ABC):
         super().__init__(*args, **kwargs)
         self._handlers: Dict[str, HandlerFn] = {}
         self._cache_enabled: Dict[str, bool] = {}
+        # Handler calls in progress, keyed by resolved URI, for coalescing
+        self._in_flight: Dict[PageURI, asyncio.Future[Page]] = {}
 
     @property
     @abstractmethod
@@ -99,36 +104,66 @@ class PageRouterMixin(ABC):
             return await self._create_page_uri(page_type, self.root, type_path, id)
         return PageURI(root=self.root, type=type_path, id=id, version=version)
 
+    @overload
     def validator(
         self, func: Callable[[P], Awaitable[bool]]
-    ) -> Callable[[P], Awaitable[bool]]:
+    ) -> Callable[[P], Awaitable[bool]]: ...
+
+    @overload
+    def validator(
+        self, func: None = None, *, ttl: Optional[timedelta] = None
+    ) -> Callable[[Callable[[P], Awaitable[bool]]], Callable[[P], Awaitable[bool]]]: ...
+
+    def validator(
+        self,
+        func: Optional[Callable[[P], Awaitable[bool]]] = None,
+        *,
+        ttl: Optional[timedelta] = None,
+    ) -> Any:
         """Decorator to register an async page validator.
 
-        All validators must be async:
+        All validators must be async. Pass ttl to trust pages that passed
+        validation within that window without calling the validator again:
 
         Example:
             @context.validator
             async def validate_email(page: EmailPage) -> bool:
                 # Could make API calls, DB queries, etc.
                 return await some_async_validation(page.email)
+
+            @context.validator(ttl=timedelta(minutes=5))
+            async def validate_thread(page: ThreadPage) -> bool:
+                return await some_async_validation(page.thread_id)
         """
-        hints = {
-            name: typ for name, typ in get_type_hints(func).items() if name != "return"
-        }
-        if len(hints) != 1:
-            raise RuntimeError("Validator function must have exactly one argument.")
-        page_type = next(iter(hints.values()))
-        if not isinstance(page_type, type) or not issubclass(page_type, Page):
-            raise RuntimeError("Validator function's argument must be a Page subclass.")
-
-        # Create a wrapper that handles the type cast safely
-        async def validator_wrapper(page: Page) -> bool:
-            if not isinstance(page, page_type):
-                return False
-            return await func(page)  # type: ignore
-
-        self.page_cache.register_validator(page_type, validator_wrapper)
-        return func
+
+        def decorator(
+            func: Callable[[P], Awaitable[bool]],
+        ) -> Callable[[P], Awaitable[bool]]:
+            hints = {
+                name: typ
+                for name, typ in get_type_hints(func).items()
+                if name != "return"
+            }
+            if len(hints) != 1:
+                raise RuntimeError("Validator function must have exactly one argument.")
+            page_type = next(iter(hints.values()))
+            if not isinstance(page_type, type) or not issubclass(page_type, Page):
+                raise RuntimeError(
+                    "Validator function's argument must be a Page subclass."
+                )
+
+            # Create a wrapper that handles the type cast safely
+            async def validator_wrapper(page: Page) -> bool:
+                if not isinstance(page, page_type):
+                    return False
+                return await func(page)  # type: ignore
+
+            self.page_cache.register_validator(page_type, validator_wrapper, ttl=ttl)
+            return func
+
+        if func is not None:
+            return decorator(func)
+        return decorator
 
     def get_handler(self, path: str) -> HandlerFn:
         return self._handlers[path]
@@ -154,30 +189,62 @@ class PageRouterMixin(ABC):
         handler = self._handlers[page_uri.type]
         page_type = self._get_handler_return_type(handler, page_uri.type)
 
-        # Try cache first if enabled
-        cached_page = await self._get_from_cache(
-            page_type, page_uri, allow_stale=allow_stale
-        )
+        # Try cache first. With caching enabled a single lookup also resolves
+        # the version a freshly generated page would be stored under.
+        if cache_enabled:
+            cached_page, page_uri = await self._lookup_in_cache(
+                page_type, page_uri, allow_stale=allow_stale
+            )
+        else:
+            cached_page = await self._get_from_cache(
+                page_type, page_uri, allow_stale=allow_stale
+            )
         if cached_page:
             return cached_page
-        # Not in cache or caching disabled - call handler
-        page = await self._call_handler_async(handler, page_uri)
-
-        # Store in cache if enabled and not already cached
-        if cache_enabled:
-            await self._store_in_cache(page, page_uri)
-
-        return page
+        # Not in cache or caching disabled - call handler, storing the result
+        # in cache if enabled and not already cached
+        return await self._call_handler_async(handler, page_uri, store=cache_enabled)
 
     async def get_pages(
         self, page_uris: Sequence[str | PageURI], allow_stale: bool = False
     ) -> List[Page]:
-        """Bulk asynchronous page retrieval with parallel execution. If allow_stale is True, will return cached pages even if they are invalid."""
+        """Bulk asynchronous page retrieval with parallel execution. If allow_stale is True, will return cached pages even if they are invalid.
+
+        Cached pages are resolved with one batched cache lookup per page type.
+        Only the misses are sent to their handlers (in parallel), and the
+        generated pages are written back to the cache in bulk.
+        """
         parsed_uris = [
             PageURI.parse(uri) if isinstance(uri, str) else uri for uri in page_uris
         ]
-        tasks = [self.get_page(uri, allow_stale=allow_stale) for uri in parsed_uris]
-        return await asyncio.gather(*tasks)
+        uris_by_type: Dict[str, List[PageURI]] = {}
+        for uri in dict.fromkeys(parsed_uris):
+            if uri.type not in self._handlers:
+                raise RuntimeError(f"No handler registered for type: {uri.type}")
+            uris_by_type.setdefault(uri.type, []).append(uri)
+
+        resolved: Dict[PageURI, Page] = {}
+        misses: List[PageURI] = []
+        for type_path, uris in uris_by_type.items():
+            handler = self._handlers[type_path]
+            page_type = self._get_handler_return_type(handler, type_path)
+            cached = await self._get_many_from_cache(page_type, uris, allow_stale)
+            resolved.update(cached)
+            misses.extend(uri for uri in uris if uri not in cached)
+
+        generated = await asyncio.gather(
+            *(self._call_handler_async(self._handlers[uri.type], uri) for uri in misses)
+        )
+        resolved.update(zip(misses, generated))
+
+        to_store = [
+            (uri, page)
+            for uri, page in zip(misses, generated)
+            if self.is_cache_enabled(uri.type)
+        ]
+        await self._store_many_in_cache(to_store)
+
+        return [resolved[uri] for uri in parsed_uris]
 
     async def _get_from_cache(
         self, page_type: Type[Page], page_uri: PageURI, allow_stale: bool = False
@@ -196,8 +263,60 @@ class PageRouterMixin(ABC):
             )
         return None
 
-    async def _call_handler_async(self, handler: HandlerFn, page_uri: PageURI) -> Page:
-        """Call the async handler to generate a page, ensuring proper URI versioning."""
+    async def _lookup_in_cache(
+        self, page_type: Type[Page], page_uri: PageURI, allow_stale: bool = False
+    ) -> Tuple[Page | None, PageURI]:
+        """Attempt to retrieve page from cache, resolving its version on a miss.
+
+        If the lookup fails, the URI is returned unchanged so the version is
+        resolved when the handler is called.
+        """
+        try:
+            cached_page, resolved_uri = await self.page_cache.lookup(
+                page_type, page_uri, allow_stale=allow_stale
+            )
+            if cached_page:
+                logger.debug(f"Found cached page for {page_uri}")
+            return cached_page, resolved_uri
+        except Exception as e:
+            logger.debug(
+                f"Error checking cache for {page_uri}: {e}, falling back to handler"
+            )
+        return None, page_uri
+
+    async def _get_many_from_cache(
+        self,
+        page_type: Type[Page],
+        page_uris: Sequence[PageURI],
+        allow_stale: bool = False,
+    ) -> Dict[PageURI, Page]:
+        """Attempt to retrieve many pages of one type from cache in one batch."""
+        try:
+            cached_pages: Dict[PageURI, Page] = dict(
+                await self.page_cache.get_many(
+                    page_type, page_uris, allow_stale=allow_stale
+                )
+            )
+            logger.debug(
+                f"Found {len(cached_pages)} of {len(page_uris)} cached pages "
+                f"for {page_type.__name__}"
+            )
+            return cached_pages
+        except Exception as e:
+            logger.debug(
+                f"Error checking cache for {page_type.__name__}: {e}, "
+                "falling back to handlers"
+            )
+        return {}
+
+    async def _call_handler_async(
+        self, handler: HandlerFn, page_uri: PageURI, store: bool = False
+    ) -> Page:
+        """Call the async handler to generate a page, ensuring proper URI versioning.
+
+        Concurrent calls for the same resolved URI share a single handler
+        invocation (and cache write, if store is True).
+        """
         if page_uri.version is None:
             page_uri = await self._create_page_uri(
                 self._get_handler_return_type(handler, page_uri.type),
@@ -206,19 +325,66 @@ class PageRouterMixin(ABC):
                 page_uri.id,
             )
 
+        in_flight = self._in_flight.get(page_uri)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(
+                self._generate_page(handler, page_uri, store)
+            )
+            self._in_flight[page_uri] = in_flight
+            in_flight.add_done_callback(
+                lambda done: self._finish_in_flight(page_uri, done)
+            )
+        else:
+            logger.debug(f"Joining in-flight request for {page_uri}")
+
+        # Shield the shared call so one caller being cancelled does not
+        # cancel it for the others
+        return await asyncio.shield(in_flight)
+
+    async def _generate_page(
+        self, handler: HandlerFn, page_uri: PageURI, store: bool
+    ) -> Page:
+        """Run the handler for a resolved URI, optionally storing the result."""
         # All handlers are now async
-        return await handler(page_uri)
+        page = await handler(page_uri)
+        if store:
+            await self._store_in_cache(page, page_uri)
+        return page
+
+    def _finish_in_flight(
+        self, page_uri: PageURI, done: "asyncio.Future[Page]"
+    ) -> None:
+        """Forget a finished in-flight call."""
+        if self._in_flight.get(page_uri) is done:
+            del self._in_flight[page_uri]
+        if not done.cancelled():
+            # Mark the exception as retrieved even if every caller gave up
+            done.exception()
 
     async def _store_in_cache(self, page: Page, page_uri: PageURI) -> None:
         """Attempt to store page in cache if not already present."""
         try:
-            # Check if page is already in cache
-            if not await self.page_cache.get(page.__class__, page_uri):
-                await self.page_cache.store(page)
+            if await self.page_cache.store_if_absent(page):
                 logger.debug(f"Stored page in cache: {page_uri}")
         except Exception as e:
             logger.debug(f"Error storing page in cache for {page_uri}: {e}")
 
+    async def _store_many_in_cache(self, pages: Sequence[Tuple[PageURI, Page]]) -> None:
+        """Attempt to store many generated pages in cache with one bulk write.
+
+        Falls back to storing pages one at a time if the bulk write fails, so
+        a single bad page does not keep the rest of the batch out of the cache.
+        """
+        if not pages:
+            return
+        try:
+            await self.page_cache.store_many([page for _, page in pages])
+            logger.debug(f"Stored {len(pages)} pages in cache")
+        except Exception as e:
+            logger.debug(f"Error bulk storing pages in cache: {e}, storing one by one")
+            for page_uri, page in pages:
+                await self._store_in_cache(page, page_uri)
+
     async def _create_page_uri(
         self, page_type: Type[Page], root: str, type_path: str, id: str
     ) -> PageURI:
@@ -175,6 +175,9 @@ class PageMetadata(BaseModel):
     token_count: Optional[int] = Field(
         None, description="Number of tokens in the document"
     )
+    validated_at: Optional[datetime] = Field(
+        default=None, description="When the cached page last passed validation"
+    )
 
 
 class TextPage(Page):
@@ -72,7 +72,13 @@ async def setup_global_context() -> None:
 
     # Create and set global context with SQL cache
     context = await ServerContext.create(
-        root=config.server_root, cache_url=config.page_cache_url
+        root=config.server_root,
+        cache_url=config.page_cache_url,
+        pool_size=config.page_cache_pool_size,
+        max_overflow=config.page_cache_max_overflow,
+        pool_pre_ping=config.page_cache_pool_pre_ping,
+        pool_recycle=config.page_cache_pool_recycle,
+        statement_cache_size=config.page_cache_statement_cache_size,
     )
     set_global_context(context)
 
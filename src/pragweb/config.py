@@ -25,6 +25,22 @@ class AppConfig(BaseModel):
     secrets_database_url: str = Field(
         description="Database URL for secrets storage",
     )
+    page_cache_pool_size: int = Field(
+        default=5,
+        description="Connections kept open to a Postgres page cache (0 disables pooling)",
+    )
+    page_cache_max_overflow: int = Field(
+        default=10, description="Extra Postgres connections allowed under load"
+    )
+    page_cache_pool_pre_ping: bool = Field(
+        default=True, description="Check pooled connections before use"
+    )
+    page_cache_pool_recycle: int = Field(
+        default=1800, description="Seconds before a pooled connection is replaced"
+    )
+    page_cache_statement_cache_size: Optional[int] = Field(
+        default=None, description="asyncpg prepared statement cache size"
+    )
 
     # AI/Agent Configuration
     retriever_agent_model: str = Field(
@@ -63,6 +79,14 @@ class AppConfig(BaseModel):
             raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
         return level
 
+    @field_validator("page_cache_pool_size", "page_cache_max_overflow")
+    @classmethod
+    def validate_pool_bounds(cls, v: int) -> int:
+        """Validate pool bounds are non-negative."""
+        if v < 0:
+            raise ValueError("page cache pool bounds must be non-negative")
+        return v
+
     @field_validator("retriever_max_iterations")
     @classmethod
     def validate_max_iterations(cls, v: int) -> int:
@@ -136,6 +160,16 @@ def load_default_config() -> AppConfig:
         server_root=os.getenv("SERVER_ROOT", "google"),
         page_cache_url=page_cache_url,
         secrets_database_url=secrets_database_url,
+        page_cache_pool_size=int(os.getenv("PAGE_CACHE_POOL_SIZE", "5")),
+        page_cache_max_overflow=int(os.getenv("PAGE_CACHE_MAX_OVERFLOW", "10")),
+        page_cache_pool_pre_ping=os.getenv("PAGE_CACHE_POOL_PRE_PING", "true").lower()
+        in ("1", "true", "yes"),
+        page_cache_pool_recycle=int(os.getenv("PAGE_CACHE_POOL_RECYCLE", "1800")),
+        page_cache_statement_cache_size=(
+            int(os.environ["PAGE_CACHE_STATEMENT_CACHE_SIZE"])
+            if os.getenv("PAGE_CACHE_STATEMENT_CACHE_SIZE")
+            else None
+        ),
         retriever_agent_model=os.getenv("RETRIEVER_AGENT_MODEL", "gpt-4o-mini"),
         retriever_max_iterations=int(os.getenv("RETRIEVER_MAX_ITERATIONS", "10")),
         google_credentials_file=os.getenv(
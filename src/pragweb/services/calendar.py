@@ -13,6 +13,9 @@ from pragweb.utils import resolve_person_identifier
 
 logger = logging.getLogger(__name__)
 
+# Cached calendar events that passed validation this recently skip the provider check
+VALIDATION_TTL = timedelta(minutes=5)
+
 
 class CalendarService(ToolkitService):
     """Orchestration service for calendar operations across multiple providers."""
@@ -55,7 +58,7 @@ class CalendarService(ToolkitService):
             return await self.create_page(page_uri, event_id, calendar_id)
 
         # Register validator for calendar events
-        @ctx.validator
+        @ctx.validator(ttl=VALIDATION_TTL)
         async def validate_calendar_event(page: CalendarEventPage) -> bool:
             return await self._validate_calendar_event(page)
 
@@ -1,8 +1,7 @@
 """Documents orchestration service that coordinates between multiple providers."""
 
-import asyncio
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Sequence
 
 from chonkie import RecursiveChunker
@@ -16,6 +15,9 @@ from pragweb.toolkit_service import ToolkitService
 
 logger = logging.getLogger(__name__)
 
+# Cached document headers that passed validation this recently skip the provider check
+VALIDATION_TTL = timedelta(minutes=5)
+
 
 class DocumentService(ToolkitService):
     """Orchestration service for document operations across multiple providers."""
@@ -72,7 +74,7 @@ class DocumentService(ToolkitService):
             return await self.create_document_chunk_page(page_uri)
 
         # Register validator for document headers
-        @ctx.validator
+        @ctx.validator(ttl=VALIDATION_TTL)
         async def validate_document_header(page: DocumentHeader) -> bool:
             return await self._validate_document_header(page)
 
@@ -586,25 +588,21 @@ class DocumentService(ToolkitService):
     async def _store_chunk_pages(
         self, chunk_pages: List[DocumentChunk], header: DocumentHeader
     ) -> None:
-        """Store chunk pages in the cache asynchronously."""
+        """Store chunk pages in the cache in a single bulk write."""
         if not chunk_pages:
             return
 
-        # Ensure DocumentChunk type is registered first to avoid race condition
-        await self.context.page_cache._registry.ensure_registered(DocumentChunk)
-
-        # Store all chunks in parallel using context
-        tasks = [
-            self.context.page_cache.store(chunk_page, parent_uri=header.uri)
-            for chunk_page in chunk_pages
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Check for exceptions and log them
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Failed to store chunk {i}: {result}")
-                raise result
+        try:
+            created = await self.context.page_cache.store_many(
+                chunk_pages, parent_uri=header.uri
+            )
+        except Exception as e:
+            logger.error(f"Failed to store chunks for {header.uri}: {e}")
+            raise
+
+        existing = len(created) - sum(created)
+        if existing:
+            logger.debug(f"{existing} chunks for {header.uri} were already cached")
 
     def _get_chunk_title(self, content: str) -> str:
         """Generate a chunk title from the first few words or sentence."""
@@ -13,6 +13,9 @@ from pragweb.utils import resolve_person_identifier
 
 logger = logging.getLogger(__name__)
 
+# Cached threads that passed validation this recently skip the provider check
+VALIDATION_TTL = timedelta(minutes=5)
+
 
 class EmailService(ToolkitService):
     """Orchestration service for email operations across multiple providers."""
@@ -57,7 +60,7 @@ class EmailService(ToolkitService):
             return await self.create_thread_page(page_uri)
 
         # Register validator for email threads
-        @ctx.validator
+        @ctx.validator(ttl=VALIDATION_TTL)
         async def validate_email_thread(page: EmailThreadPage) -> bool:
             return await self._validate_email_thread(page)
 
@@ -16,6 +16,9 @@ from pragweb.toolkit_service import ToolkitService
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached people returned for a single name match
+MAX_EXISTING_MATCHES = 50
+
 
 @dataclass(frozen=True)
 class PersonInfo:
@@ -117,6 +120,8 @@ class PeopleService(ToolkitService):
         full_name_matches: List[PersonPage] = await (
             self.context.page_cache.find(PersonPage)
             .where(lambda t: t.full_name.ilike(f"%{identifier_lower}%"))
+            .order_by(lambda t: t.full_name)
+            .limit(MAX_EXISTING_MATCHES)
             .all()
         )
         if full_name_matches:
@@ -126,6 +131,8 @@ class PeopleService(ToolkitService):
         first_name_matches: List[PersonPage] = await (
             self.context.page_cache.find(PersonPage)
             .where(lambda t: t.first_name.ilike(f"%{identifier_lower}%"))
+            .order_by(lambda t: t.full_name)
+            .limit(MAX_EXISTING_MATCHES)
             .all()
         )
         return first_name_matches
@@ -450,12 +457,11 @@ class PeopleService(ToolkitService):
 
     async def _find_existing_person_by_email(self, email: str) -> Optional[PersonPage]:
         """Find existing person in page cache by email address."""
-        matches: List[PersonPage] = await (
+        return await (
             self.context.page_cache.find(PersonPage)
             .where(lambda t: t.email == email.lower())
-            .all()
+            .first()
         )
-        return matches[0] if matches else None
 
     async def _search_explicit_sources(self, identifier: str) -> List[PersonInfo]:
         """Search explicit sources (Google People API and Directory API) for the identifier."""
@@ -4,6 +4,7 @@ This module contains comprehensive tests for the ServerContext functionality,
 including page creation, caching, retrieval, and search functionality.
 """
 
+from datetime import timedelta
 from typing import Any, List, Optional
 
 import pytest
@@ -302,6 +303,32 @@ class TestValidatorIntegration:
 
         # This demonstrates that the validator is working when pages are accessed
 
+    @pytest.mark.asyncio
+    async def test_validator_with_ttl_skips_recent_pages(self, context) -> None:
+        """Test that a validator registered with a ttl trusts fresh pages."""
+        calls = []
+
+        @context.route("gdoc")
+        async def handle_gdoc(
+            page_uri: PageURI,
+        ) -> TestValidatorIntegration.GoogleDocPage:
+            return TestValidatorIntegration.GoogleDocPage(
+                uri=page_uri,
+                title=f"Document {page_uri.id}",
+                content=f"Content for {page_uri.id}",
+                revision="current",
+            )
+
+        @context.validator(ttl=timedelta(minutes=5))
+        async def validate_gdoc(page: TestValidatorIntegration.GoogleDocPage) -> bool:
+            calls.append(page.uri)
+            return page.revision == "current"
+
+        page = await context.get_page("test/gdoc:doc1")
+        cached = await context.get_page(page.uri)
+        assert cached.title == "Document doc1"
+        assert calls == []
+
 
 class TestStrictHandlerValidation:
     """Test strict handler signature validation functionality."""
@@ -120,7 +120,11 @@ def mock_page_cache() -> MagicMock:
     """Provide a mock PageCache for testing."""
     mock = MagicMock(spec=PageCache)
     mock.get = AsyncMock(return_value=None)
+    mock.lookup = AsyncMock(
+        side_effect=lambda page_type, uri, allow_stale=False: (None, uri)
+    )
     mock.store = MagicMock(return_value=True)
+    mock.store_if_absent = AsyncMock(return_value=True)
     mock.get_latest_version = MagicMock(return_value=None)
     mock._storage = MagicMock()
     mock._storage._registry = MagicMock()
@@ -477,7 +481,11 @@ class TestGetPage:
             title="Cached",
             content="From cache",
         )
-        page_router_with_mock._page_cache.get.return_value = cached_page
+        page_router_with_mock._page_cache.lookup.side_effect = None
+        page_router_with_mock._page_cache.lookup.return_value = (
+            cached_page,
+            cached_page.uri,
+        )
 
         @page_router_with_mock.route("test")
         async def handler(page_uri: PageURI) -> SamplePage:
@@ -488,15 +496,13 @@ class TestGetPage:
 
         assert page == cached_page
         assert page.title == "Cached"
-        page_router_with_mock._page_cache.get.assert_called_once()
+        page_router_with_mock._page_cache.lookup.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_get_page_with_cache_miss(
         self, page_router_with_mock: PageRouter
     ) -> None:
         """Test page retrieval with cache miss."""
-        # Setup mock to return None (cache miss)
-        page_router_with_mock._page_cache.get.return_value = None
 
         @page_router_with_mock.route("test")
         async def handler(page_uri: PageURI) -> SamplePage:
@@ -506,9 +512,11 @@ class TestGetPage:
         page = await page_router_with_mock.get_page(page_uri)
 
         assert page.title == "Fresh"
-        # get() is called twice - once for initial cache check, once in _store_in_cache
-        assert page_router_with_mock._page_cache.get.call_count == 2
-        page_router_with_mock._page_cache.store.assert_called_once()
+        # One lookup on the way in and one conditional insert on the way out
+        page_router_with_mock._page_cache.lookup.assert_called_once()
+        page_router_with_mock._page_cache.store_if_absent.assert_called_once_with(page)
+        page_router_with_mock._page_cache.get.assert_not_called()
+        page_router_with_mock._page_cache.store.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_page_cache_disabled(
@@ -526,6 +534,7 @@ class TestGetPage:
         assert page.title == "Fresh"
         # Cache store should not be called when disabled
         page_router_with_mock._page_cache.store.assert_not_called()
+        page_router_with_mock._page_cache.store_if_absent.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_page_cache_error_handled(
@@ -533,7 +542,7 @@ class TestGetPage:
     ) -> None:
         """Test cache error is handled gracefully."""
         # Setup mock to raise exception
-        page_router_with_mock._page_cache.get.side_effect = Exception("Cache error")
+        page_router_with_mock._page_cache.lookup.side_effect = Exception("Cache error")
 
         @page_router_with_mock.route("test")
         async def handler(page_uri: PageURI) -> SamplePage:
@@ -699,6 +708,157 @@ class TestGetPages:
         assert set(call_started) == {"page1", "page2", "page3"}
         assert set(call_order) == {"page1", "page2", "page3"}
 
+    @pytest.mark.asyncio
+    async def test_get_pages_only_calls_handlers_for_misses(
+        self, page_router: PageRouter
+    ) -> None:
+        """Test that cached pages are served in bulk and only misses hit handlers."""
+        handled = []
+
+        @page_router.route("test")
+        async def handler(page_uri: PageURI) -> SamplePage:
+            handled.append(page_uri.id)
+            return SamplePage(uri=page_uri, title="Fresh", content="Content")
+
+        cached = SamplePage(
+            uri=PageURI(root="test", type="test", id="page1", version=1),
+            title="Cached",
+            content="Content",
+        )
+        await page_router.page_cache.store(cached)
+
+        page_uris = [
+            PageURI(root="test", type="test", id="page1", version=1),
+            PageURI(root="test", type="test", id="page2", version=1),
+        ]
+        pages = await page_router.get_pages(page_uris)
+
+        assert [page.title for page in pages] == ["Cached", "Fresh"]
+        assert handled == ["page2"]
+
+        # Misses were written back, so a second call is served from cache
+        await page_router.get_pages(page_uris)
+        assert handled == ["page2"]
+
+    @pytest.mark.asyncio
+    async def test_get_pages_duplicate_uris(self, page_router: PageRouter) -> None:
+        """Test that duplicate URIs share a single handler call."""
+        handled = []
+
+        @page_router.route("test")
+        async def handler(page_uri: PageURI) -> SamplePage:
+            handled.append(page_uri.id)
+            return SamplePage(uri=page_uri, title="Test", content="Content")
+
+        page_uri = PageURI(root="test", type="test", id="page1", version=1)
+        pages = await page_router.get_pages([page_uri, page_uri])
+
+        assert len(pages) == 2
+        assert pages[0].uri == pages[1].uri
+        assert handled == ["page1"]
+
+    @pytest.mark.asyncio
+    async def test_get_pages_unregistered_type(self, page_router: PageRouter) -> None:
+        """Test that get_pages rejects URIs without a handler."""
+        with pytest.raises(RuntimeError, match="No handler registered"):
+            await page_router.get_pages(
+                [PageURI(root="test", type="missing", id="x", version=1)]
+            )
+
+
+class TestRequestCoalescing:
+    """Test that concurrent requests for the same page share one handler call."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_page_calls_handler_once(
+        self, page_router: PageRouter
+    ) -> None:
+        handled = []
+
+        @page_router.route("test")
+        async def handler(page_uri: PageURI) -> SamplePage:
+            handled.append(page_uri)
+            await asyncio.sleep(0.01)
+            return SamplePage(uri=page_uri, title="Test", content="Content")
+
+        page_uri = PageURI(root="test", type="test", id="page1", version=1)
+        pages = await asyncio.gather(
+            *(page_router.get_page(page_uri) for _ in range(5))
+        )
+
+        assert handled == [page_uri]
+        assert all(page.uri == page_uri for page in pages)
+        assert page_router._in_flight == {}
+        assert await page_router.page_cache.get(SamplePage, page_uri) is not None
+
+    @pytest.mark.asyncio
+    async def test_unversioned_requests_coalesce_on_resolved_uri(
+        self, page_router: PageRouter
+    ) -> None:
+        handled = []
+
+        @page_router.route("test")
+        async def handler(page_uri: PageURI) -> SamplePage:
+            handled.append(page_uri)
+            await asyncio.sleep(0.01)
+            return SamplePage(uri=page_uri, title="Test", content="Content")
+
+        pages = await asyncio.gather(
+            page_router.get_page("test/test:page1"),
+            page_router.get_page("test/test:page1"),
+            page_router.get_pages(["test/test:page1"]),
+        )
+
+        assert handled == [PageURI(root="test", type="test", id="page1", version=1)]
+        assert pages[0].uri == pages[1].uri == pages[2][0].uri
+
+    @pytest.mark.asyncio
+    async def test_handler_error_reaches_every_caller(
+        self, page_router: PageRouter
+    ) -> None:
+        calls = 0
+
+        @page_router.route("test")
+        async def handler(page_uri: PageURI) -> SamplePage:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError("provider unavailable")
+
+        page_uri = PageURI(root="test", type="test", id="page1", version=1)
+        results = await asyncio.gather(
+            page_router.get_page(page_uri),
+            page_router.get_page(page_uri),
+            return_exceptions=True,
+        )
+
+        assert calls == 1
+        assert all(isinstance(result, ValueError) for result in results)
+        assert page_router._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(
+        self, page_router: PageRouter
+    ) -> None:
+        release = asyncio.Event()
+
+        @page_router.route("test")
+        async def handler(page_uri: PageURI) -> SamplePage:
+            await release.wait()
+            return SamplePage(uri=page_uri, title="Test", content="Content")
+
+        page_uri = PageURI(root="test", type="test", id="page1", version=1)
+        first = asyncio.create_task(page_router.get_page(page_uri))
+        second = asyncio.create_task(page_router.get_page(page_uri))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+        release.set()
+
+        page = await second
+        assert page.uri == page_uri
+        assert first.cancelled()
+
 
 class TestPrivateMethods:
     """Test private methods of PageRouter."""
@@ -761,8 +921,6 @@ class TestPrivateMethods:
         self, page_router_with_mock: PageRouter
     ) -> None:
         """Test successful cache storage."""
-        page_router_with_mock._page_cache.get.return_value = None  # Not already cached
-
         page = SamplePage(
             uri=PageURI(root="test", type="test", id="page1", version=1),
             title="Test",
@@ -772,19 +930,14 @@ class TestPrivateMethods:
 
         await page_router_with_mock._store_in_cache(page, page_uri)
 
-        page_router_with_mock._page_cache.store.assert_called_once_with(page)
+        page_router_with_mock._page_cache.store_if_absent.assert_called_once_with(page)
 
     @pytest.mark.asyncio
     async def test_store_in_cache_already_cached(
         self, page_router_with_mock: PageRouter
     ) -> None:
         """Test cache storage when page is already cached."""
-        existing_page = SamplePage(
-            uri=PageURI(root="test", type="test", id="page1", version=1),
-            title="Existing",
-            content="Existing content",
-        )
-        page_router_with_mock._page_cache.get.return_value = existing_page
+        page_router_with_mock._page_cache.store_if_absent.return_value = False
 
         page = SamplePage(
             uri=PageURI(root="test", type="test", id="page1", version=1),
@@ -793,9 +946,10 @@ class TestPrivateMethods:
         )
         page_uri = page.uri
 
+        # An existing page is not an error, and is not read back first
         await page_router_with_mock._store_in_cache(page, page_uri)
 
-        # Should not call store when already cached
+        page_router_with_mock._page_cache.get.assert_not_called()
         page_router_with_mock._page_cache.store.assert_not_called()
 
     @pytest.mark.asyncio
@@ -803,7 +957,9 @@ class TestPrivateMethods:
         self, page_router_with_mock: PageRouter
     ) -> None:
         """Test cache storage error is handled gracefully."""
-        page_router_with_mock._page_cache.get.side_effect = Exception("Cache error")
+        page_router_with_mock._page_cache.store_if_absent.side_effect = Exception(
+            "Cache error"
+        )
 
         page = SamplePage(
             uri=PageURI(root="test", type="test", id="page1", version=1),